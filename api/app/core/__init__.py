@@ -1,5 +1,6 @@
 """Core services for JR AutoRAG backend."""
 
+from .answer_cache import AnswerCache
 from .config_store import ConfigStore
 from .documents import DocumentStore
 from .gatherer import Gatherer
@@ -7,10 +8,12 @@ from .ingest import IngestPipeline
 from .orchestrator import Orchestrator
 from .planner import Planner
 from .providers import ProviderFactory
+from .query_batcher import QueryBatcher
 from .retrieval import RetrievalEngine
 from .telemetry import TelemetryStore
 
 __all__ = [
+    "AnswerCache",
     "ConfigStore",
     "DocumentStore",
     "Planner",
@@ -19,5 +22,6 @@ __all__ = [
     "IngestPipeline",
     "Gatherer",
     "Orchestrator",
+    "QueryBatcher",
     "TelemetryStore",
 ]
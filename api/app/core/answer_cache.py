@@ -0,0 +1,94 @@
+"""Answer cache that lets repeated questions skip the LLM provider."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import orjson
+
+from .gatherer import EvidenceChunk
+from .persistence import RLock, atomic_write_bytes
+
+
+@dataclass
+class _Entry:
+    query: str
+    signature: str
+    answer: str
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class AnswerCache:
+    """Cache of generated answers, persisted as JSONL.
+
+    A hit needs the same normalized question (case and whitespace folded) and
+    the same evidence signature. There is deliberately no similarity tier:
+    questions that differ only in a wh-word or a negation look alike to bag of
+    words measures but need different answers.
+
+    `store` writes to disk, so async callers should run it in a worker thread.
+    """
+
+    def __init__(self, path: Path | None = None, max_entries: int = 2048) -> None:
+        self._path = Path(path or Path.cwd() / "data" / "answers.jsonl")
+        self._max_entries = max_entries
+        self._lock = RLock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._log_lines = 0
+        if self._path.exists():
+            for line in self._path.read_bytes().splitlines():
+                try:
+                    self._insert(_Entry(**orjson.loads(line)))
+                except (orjson.JSONDecodeError, TypeError):
+                    continue
+                self._log_lines += 1
+
+    @staticmethod
+    def signature(provider_key: str, chunks: Iterable[EvidenceChunk]) -> str:
+        """SHA-1 over the provider identity and the sorted evidence (id + text)."""
+        digest = hashlib.sha1(provider_key.encode("utf-8"))
+        for chunk in sorted(chunks, key=lambda c: c.id):
+            digest.update(b"\0")
+            digest.update(chunk.id.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(chunk.snippet.encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, query: str, signature: str) -> str | None:
+        """Return the cached answer for this question and evidence, else None."""
+        key = (_normalize(query), signature)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.answer
+
+    def store(self, query: str, signature: str, answer: str) -> None:
+        entry = _Entry(query=_normalize(query), signature=signature, answer=answer)
+        line = orjson.dumps(asdict(entry)) + b"\n"
+        with self._lock:
+            self._insert(entry)
+            self._log_lines += 1
+            if self._log_lines > 2 * self._max_entries:
+                payload = b"".join(orjson.dumps(asdict(e)) + b"\n" for e in self._entries.values())
+                atomic_write_bytes(self._path, payload)
+                self._log_lines = len(self._entries)
+            else:
+                with self._path.open("ab") as handle:
+                    handle.write(line)
+
+    def _insert(self, entry: _Entry) -> None:
+        key = (entry.query, entry.signature)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
-from threading import RLock
+
+import orjson
 
 from ..schemas.config import AppConfig
+from .persistence import RLock, atomic_write_bytes
+
+# pretty-print config.json only when debugging; compact output otherwise
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 if os.environ.get("JR_DEBUG") else 0
 
 
 class ConfigStore:
@@ -25,11 +30,11 @@ class ConfigStore:
 
     def read(self) -> AppConfig:
         with self._lock:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
+            data = orjson.loads(self._path.read_bytes())
             return AppConfig.model_validate(data)
 
     def write(self, cfg: AppConfig) -> AppConfig:
         payload = cfg.model_dump(mode="json")
         with self._lock:
-            self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            atomic_write_bytes(self._path, orjson.dumps(payload, option=_DUMP_OPTIONS))
         return cfg
@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
-import json
+import os
+import random
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
-from threading import RLock
+from queue import SimpleQueue
+from types import MappingProxyType
+from typing import Any
+
+import msgspec
+
+from .persistence import RLock, atomic_write_bytes, wait_for_writer
+
+# fsync the log once this many bytes or seconds have accumulated since the last sync
+_FSYNC_BYTES = 1 << 20
+_FSYNC_INTERVAL = 1.0
+# never compact logs shorter than this, regardless of the live/dead ratio
+_COMPACT_MIN_LINES = 1000
+
+# ids only need to be unique within this store, so draw them from a PRNG seeded
+# once from os.urandom instead of issuing a urandom syscall per document
+_prng = random.Random(os.urandom(32))
+os.register_at_fork(after_in_child=lambda: _prng.seed(os.urandom(32)))
+
+
+def _new_id() -> str:
+    return str(uuid.UUID(bytes=_prng.randbytes(16), version=4))
 
 
 @dataclass
@@ -17,44 +43,189 @@ class Document:
     metadata: dict[str, str]
 
 
+class _LogEntry(msgspec.Struct, omit_defaults=True):
+    """One line of the operation log: `doc` for add/upsert, `id` for delete."""
+
+    op: str
+    doc: Document | None = None
+    id: str | None = None
+
+
+# msgspec parses JSON straight into _LogEntry/Document instances in one C pass,
+# with no intermediate dict per line
+_LOG_DECODER = msgspec.json.Decoder(_LogEntry)
+_LOG_ENCODER = msgspec.json.Encoder()
+
+
+class _Compact:
+    """Writer-queue marker asking for the log to be rewritten from `docs`."""
+
+    def __init__(self, docs: list[Document]) -> None:
+        self.docs = docs
+
+
 class DocumentStore:
-    """Filesystem-backed document registry."""
+    """Filesystem-backed document registry.
+
+    Mutations are appended to a JSONL operation log (`add`/`upsert`/`delete`)
+    by a background writer thread; the log is replayed on startup and
+    compacted once dead entries outnumber live documents.
+
+    Readers never lock: writers publish a fresh read-only snapshot of the
+    document map, so `get`/`list` are a single attribute load.
+
+    A failed write is re-raised from the next mutation or `flush()`. Until
+    then the writer drops further appends (they would leave a hole in the
+    log) and re-raising queues a full rewrite from memory, which clears the
+    error once it succeeds.
+    """
 
     def __init__(self, path: Path | None = None) -> None:
-        self._path = Path(path or Path.cwd() / "data" / "documents.json")
-        self._lock = RLock()
+        self._path = Path(path or Path.cwd() / "data" / "documents.jsonl")
+        self._writer_lock = RLock()
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._docs: dict[str, Document] = {}
+        docs: dict[str, Document] = {}
+        self._log_lines = 0
+        legacy = self._path.with_suffix(".json")
         if self._path.exists():
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
-            self._docs = {item["id"]: Document(**item) for item in raw}
+            self._replay(docs)
+        elif legacy.exists():
+            docs = {doc.id: doc for doc in msgspec.json.decode(legacy.read_bytes(), type=list[Document])}
+            self._rewrite(list(docs.values()))
+            self._log_lines = len(docs)
+        self._snapshot: Mapping[str, Document] = MappingProxyType(docs)
+        self._handle = self._path.open("ab")
+        self._queue: SimpleQueue[Any] = SimpleQueue()
+        self._error: OSError | None = None
+        self._writer = threading.Thread(target=self._drain, name="document-store-writer", daemon=True)
+        self._writer.start()
+
+    def _replay(self, docs: dict[str, Document]) -> None:
+        with self._path.open("rb") as handle:
+            for line in handle:
+                try:
+                    entry = _LOG_DECODER.decode(line)
+                except msgspec.DecodeError:
+                    # torn tail from an interrupted write
+                    continue
+                self._log_lines += 1
+                if entry.doc is not None and entry.op in ("add", "upsert"):
+                    docs[entry.doc.id] = entry.doc
+                elif entry.id is not None and entry.op == "delete":
+                    docs.pop(entry.id, None)
+
+    def _rewrite(self, docs: list[Document]) -> None:
+        atomic_write_bytes(self._path, b"".join(self._encode("upsert", doc) for doc in docs))
+
+    @staticmethod
+    def _encode(op: str, doc: Document) -> bytes:
+        return _LOG_ENCODER.encode(_LogEntry(op=op, doc=doc)) + b"\n"
 
-    def _persist(self) -> None:
-        payload = [asdict(doc) for doc in self._docs.values()]
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    def _drain(self) -> None:
+        unsynced = 0
+        last_sync = time.monotonic()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if isinstance(item, threading.Event):
+                try:
+                    if self._error is None:
+                        self._handle.flush()
+                        os.fsync(self._handle.fileno())
+                        unsynced, last_sync = 0, time.monotonic()
+                except OSError as exc:
+                    self._error = exc
+                finally:
+                    item.set()
+                continue
+            try:
+                if isinstance(item, _Compact):
+                    with suppress(OSError):
+                        self._handle.close()
+                    self._rewrite(item.docs)
+                    self._handle = self._path.open("ab")
+                    unsynced, last_sync = 0, time.monotonic()
+                    self._error = None
+                    continue
+                if self._error is not None:
+                    continue
+                self._handle.write(item)
+                unsynced += len(item)
+                if unsynced >= _FSYNC_BYTES or time.monotonic() - last_sync >= _FSYNC_INTERVAL:
+                    self._handle.flush()
+                    os.fsync(self._handle.fileno())
+                    unsynced, last_sync = 0, time.monotonic()
+                elif self._queue.empty():
+                    self._handle.flush()
+            except OSError as exc:
+                self._error = exc
+
+    def _raise_write_error(self) -> None:
+        """Re-raise a failed background write, queueing a rewrite of the log from memory."""
+        exc = self._error
+        if exc is not None:
+            self.compact()
+            raise exc
+
+    def _append(self, line: bytes) -> None:
+        """Queue one log line; callers hold `self._writer_lock` so log order matches memory."""
+        self._log_lines += 1
+        self._queue.put(line)
+        if self._log_lines > max(_COMPACT_MIN_LINES, 2 * len(self._snapshot)):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the log so it holds exactly one entry per live document."""
+        with self._writer_lock:
+            self._log_lines = len(self._snapshot)
+            self._queue.put(_Compact(list(self._snapshot.values())))
+
+    def flush(self) -> None:
+        """Block until every queued mutation is written and fsynced."""
+        done = threading.Event()
+        self._queue.put(done)
+        wait_for_writer(done, self._writer)
+        self._raise_write_error()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._writer.join()
+            with suppress(OSError):
+                self._handle.close()
 
     def add(self, title: str, text: str, metadata: dict[str, str] | None = None) -> Document:
-        with self._lock:
-            doc = Document(id=str(uuid.uuid4()), title=title, text=text, metadata=metadata or {})
-            self._docs[doc.id] = doc
-            self._persist()
-            return doc
+        doc = Document(id=_new_id(), title=title, text=text, metadata=metadata or {})
+        self._put("add", doc)
+        return doc
 
     def list(self) -> list[Document]:
-        with self._lock:
-            return list(self._docs.values())
+        return list(self._snapshot.values())
 
     def get(self, doc_id: str) -> Document | None:
-        with self._lock:
-            return self._docs.get(doc_id)
+        return self._snapshot.get(doc_id)
 
     def upsert(self, doc: Document) -> None:
-        with self._lock:
-            self._docs[doc.id] = doc
-            self._persist()
+        self._put("upsert", doc)
+
+    def _put(self, op: str, doc: Document) -> None:
+        line = self._encode(op, doc)
+        with self._writer_lock:
+            self._raise_write_error()
+            docs = dict(self._snapshot)
+            docs[doc.id] = doc
+            self._snapshot = MappingProxyType(docs)
+            self._append(line)
 
     def delete(self, doc_id: str) -> None:
-        with self._lock:
-            if doc_id in self._docs:
-                del self._docs[doc_id]
-                self._persist()
+        line = _LOG_ENCODER.encode(_LogEntry(op="delete", id=doc_id)) + b"\n"
+        with self._writer_lock:
+            self._raise_write_error()
+            if doc_id in self._snapshot:
+                docs = dict(self._snapshot)
+                del docs[doc_id]
+                self._snapshot = MappingProxyType(docs)
+                self._append(line)
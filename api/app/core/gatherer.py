@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from .retrieval import RetrievalEngine, RetrievalResult
+from .text import count_words
 
 
 @dataclass
@@ -13,6 +14,7 @@ class EvidenceChunk:
     title: str
     snippet: str
     score: float
+    tokens: int = 0
 
 
 @dataclass
@@ -27,16 +29,24 @@ class Gatherer:
         self._retrieval = retrieval
 
     def gather(self, query: str, top_k: int) -> EvidenceBundle:
-        results: list[RetrievalResult] = self._retrieval.query(query, top_k=top_k)
+        return self.gather_batch([query], [top_k])[0]
+
+    def gather_batch(self, queries: list[str], top_ks: list[int]) -> list[EvidenceBundle]:
+        """Gather evidence for several queries using a single batched retrieval pass."""
+        batch = self._retrieval.query_batch(queries, top_ks)
+        return [self._bundle(results, top_k) for results, top_k in zip(batch, top_ks, strict=True)]
+
+    def _bundle(self, results: list[RetrievalResult], top_k: int) -> EvidenceBundle:
         chunks = [
             EvidenceChunk(
                 id=result.document.id,
                 title=result.document.title,
                 snippet=result.document.text,
                 score=result.score,
+                tokens=count_words(result.document.text),
             )
             for result in results
         ]
         coverage = min(1.0, len(chunks) / top_k) if top_k else 0.0
-        token_estimate = sum(len(chunk.snippet.split()) for chunk in chunks)
+        token_estimate = sum(chunk.tokens for chunk in chunks)
         return EvidenceBundle(chunks=chunks, coverage=coverage, token_estimate=token_estimate)
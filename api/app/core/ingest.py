@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import codecs
 import io
 import mimetypes
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 try:  # pragma: no cover - optional dependency
     from pypdf import PdfReader  # type: ignore
@@ -33,6 +36,43 @@ except ImportError:  # pragma: no cover
 from .documents import DocumentStore
 from .retrieval import RetrievalEngine
 
+# lightweight removal of common markdown tokens: single characters via one
+# C-level translate pass, then the remaining list-item prefix
+_MARKDOWN_CHARS = str.maketrans("", "", "#*`>")
+
+# uploads are decoded in blocks of this size rather than read whole
+_READ_BLOCK = 1 << 20
+
+
+@lru_cache(maxsize=256)
+def _guess_type(filename: str) -> str | None:
+    return mimetypes.guess_type(filename)[0]
+
+
+@lru_cache(maxsize=256)
+def _guess_extension(content_type: str) -> str:
+    return (mimetypes.guess_extension(content_type) or "").lower()
+
+
+def _read_text(source: BinaryIO) -> str:
+    source.seek(0)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    buffer = io.StringIO()
+    while block := source.read(_READ_BLOCK):
+        buffer.write(decoder.decode(block))
+    buffer.write(decoder.decode(b"", final=True))
+    return buffer.getvalue()
+
+
+def _ocr_page(image) -> str:
+    try:
+        return pytesseract.image_to_string(image) or ""  # type: ignore[attr-defined]
+    except Exception as exc:
+        print(f"Error OCRing image page: {exc}")
+        return ""
+    finally:
+        image.close()
+
 
 @dataclass
 class IngestResult:
@@ -48,22 +88,41 @@ class IngestPipeline:
         self._store = store
         self._retrieval = retrieval
 
-    def ingest_text(self, title: str, text: str, metadata: dict[str, str] | None = None) -> IngestResult:
+    def ingest_text(
+        self, title: str, text: str, metadata: dict[str, str] | None = None, rebuild_index: bool = True
+    ) -> IngestResult:
+        """Store a document; pass `rebuild_index=False` when batching and call `build()` once after."""
         meta = self._prepare_metadata(metadata)
         chunks = self._chunk(text)
         combined = "\n\n".join(chunks)
         doc = self._store.add(title=title, text=combined, metadata=meta)
-        self._retrieval.build()
+        if rebuild_index:
+            self._retrieval.build()
         return IngestResult(document_id=doc.id, title=doc.title, chunk_count=len(chunks))
 
-    def ingest_file(self, title: str, content: bytes, metadata: dict[str, str] | None = None) -> IngestResult:
+    def ingest_file(
+        self, title: str, content: bytes, metadata: dict[str, str] | None = None, rebuild_index: bool = True
+    ) -> IngestResult:
+        return self.ingest_stream(
+            title=title, fileobj=io.BytesIO(content), metadata=metadata, rebuild_index=rebuild_index
+        )
+
+    def ingest_stream(
+        self, title: str, fileobj: BinaryIO, metadata: dict[str, str] | None = None, rebuild_index: bool = True
+    ) -> IngestResult:
+        """Ingest a file from a seekable binary file object.
+
+        Text is decoded in fixed-size blocks and the PDF/DOCX parsers read the
+        file object directly, so the raw upload never has to sit in memory as
+        one bytes object.
+        """
         meta = {**(metadata or {})}
         meta.setdefault("filename", title)
         meta.setdefault("original_filename", meta["filename"])
-        meta.setdefault("content_type", mimetypes.guess_type(meta["filename"])[0] or "text/plain")
-        meta["filesize"] = str(len(content))
-        text = self._extract_text(content, meta)
-        return self.ingest_text(title=title, text=text, metadata=meta)
+        meta.setdefault("content_type", _guess_type(meta["filename"]) or "text/plain")
+        meta["filesize"] = str(fileobj.seek(0, os.SEEK_END))
+        text = self._extract_text(fileobj, meta)
+        return self.ingest_text(title=title, text=text, metadata=meta, rebuild_index=rebuild_index)
 
     def _prepare_metadata(self, metadata: dict[str, str] | None) -> dict[str, str]:
         meta = {**(metadata or {})}
@@ -77,50 +136,49 @@ class IngestPipeline:
                 return Path(filename).suffix.lower()
             content_type = metadata.get("content_type")
             if content_type:
-                return (mimetypes.guess_extension(content_type) or "").lower()
+                return _guess_extension(content_type)
         return ""
 
-    def _extract_text(self, content: bytes, metadata: dict[str, str] | None = None) -> str:
+    def _extract_text(self, source: BinaryIO, metadata: dict[str, str] | None = None) -> str:
         ext = self._infer_extension(metadata)
         if ext in {".md", ".markdown"}:
-            return self._extract_markdown(content)
+            return self._extract_markdown(source)
         if ext == ".pdf":
-            text = self._extract_pdf_text(content)
+            text = self._extract_pdf_text(source)
             if text.strip():
                 return text
-            ocr_text = self._ocr_pdf(content)
+            # pdf2image needs the whole document; only the OCR fallback pays for that
+            source.seek(0)
+            ocr_text = self._ocr_pdf(source.read())
             if ocr_text.strip():
                 return ocr_text
         if ext in {".doc", ".docx"} and docx2txt:
             try:
-                suffix = ext or ".docx"
-                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                    tmp.write(content)
-                    tmp.flush()
-                    tmp_path = tmp.name
-                try:
-                    return docx2txt.process(tmp_path)  # type: ignore[arg-type]
-                finally:
-                    os.unlink(tmp_path)
+                # docx2txt hands its argument to zipfile.ZipFile, which reads file-likes directly
+                source.seek(0)
+                return docx2txt.process(source)  # type: ignore[arg-type]
             except Exception:
                 pass
-        return content.decode("utf-8", errors="ignore")
+        return _read_text(source)
 
-    def _extract_markdown(self, content: bytes) -> str:
-        text = content.decode("utf-8", errors="ignore")
-        # lightweight removal of common markdown tokens
-        replacements = ["#", "*", "`", ">", "- ", "* "]
-        for token in replacements:
-            text = text.replace(token, "")
-        return text
+    def _extract_markdown(self, source: BinaryIO) -> str:
+        text = _read_text(source)
+        return text.translate(_MARKDOWN_CHARS).replace("- ", "")
 
-    def _extract_pdf_text(self, content: bytes) -> str:
+    def _extract_pdf_text(self, source: BinaryIO) -> str:
         if not PdfReader:
             return ""
         try:
-            reader = PdfReader(io.BytesIO(content))  # type: ignore[name-defined]
-            pages = [page.extract_text() or "" for page in reader.pages]
-            return "\n".join(pages)
+            source.seek(0)
+            reader = PdfReader(source)  # type: ignore[name-defined]
+            # write pages straight into one buffer so each page's text can be
+            # released as soon as it is copied, instead of holding them all
+            buffer = io.StringIO()
+            for index, page in enumerate(reader.pages):
+                if index:
+                    buffer.write("\n")
+                buffer.write(page.extract_text() or "")
+            return buffer.getvalue()
         except Exception as exc:
             print(f"Error extracting PDF text: {exc}")
             return ""
@@ -128,30 +186,35 @@ class IngestPipeline:
     def _ocr_pdf(self, content: bytes) -> str:
         if not convert_from_bytes or not pytesseract:
             return ""
+        workers = os.cpu_count() or 1
         try:
-            images = convert_from_bytes(content)  # type: ignore[name-defined]
+            images = convert_from_bytes(content, thread_count=workers)  # type: ignore[name-defined]
         except Exception as exc:
             print(f"Error converting PDF to images for OCR: {exc}")
             return ""
-        text_chunks: list[str] = []
-        for image in images:
-            try:
-                text = pytesseract.image_to_string(image)  # type: ignore[attr-defined]
-                if text:
-                    text_chunks.append(text)
-            except Exception as exc:
-                print(f"Error OCRing image page: {exc}")
-            finally:
-                image.close()
+        if not images:
+            return ""
+        # each page is OCR'd by its own tesseract subprocess, so threads are enough
+        # to keep every core busy; results come back in page order
+        with ThreadPoolExecutor(max_workers=min(workers, len(images))) as pool:
+            text_chunks = [text for text in pool.map(_ocr_page, images) if text]
         return "\n".join(text_chunks)
 
     def _chunk(self, text: str, target: int = 800) -> list[str]:
-        clean = text.replace("\r", "")
-        paragraphs = [p.strip() for p in clean.split("\n\n") if p.strip()]
+        clean = text.replace("\r", "") if "\r" in text else text
         chunks: list[str] = []
         current: list[str] = []
         current_len = 0
-        for para in paragraphs:
+        # walk paragraph boundaries with find() rather than materializing split()
+        pos, end = 0, len(clean)
+        while pos <= end:
+            boundary = clean.find("\n\n", pos)
+            if boundary == -1:
+                boundary = end
+            para = clean[pos:boundary].strip()
+            pos = boundary + 2
+            if not para:
+                continue
             if current_len + len(para) > target and current:
                 chunks.append("\n".join(current))
                 current = []
@@ -0,0 +1,27 @@
+"""Prometheus metrics for the query pipeline."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import Histogram  # type: ignore
+except ImportError:  # pragma: no cover
+    Histogram = None  # type: ignore
+
+
+class _NoopMetric:
+    """Stand-in with the metric API used here, for when prometheus_client is absent."""
+
+    def labels(self, **_: str) -> _NoopMetric:
+        return self
+
+    def observe(self, _: float) -> None:
+        pass
+
+
+# seconds each question spent per pipeline stage; a question answered in a
+# batch records the shared retrieval pass as its retrieve time
+QUERY_LATENCY = (
+    Histogram("jr_autorag_query_stage_seconds", "Query pipeline stage latency.", ["stage"])
+    if Histogram is not None
+    else _NoopMetric()
+)
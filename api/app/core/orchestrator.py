@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from ..schemas.config import AppConfig
-from .gatherer import Gatherer
-from .planner import Planner
+from .answer_cache import AnswerCache
+from .gatherer import EvidenceBundle, Gatherer
+from .metrics import QUERY_LATENCY
+from .planner import Planner, RetrievalPlan
 from .providers import LLMProvider, ProviderError, ProviderFactory
 from .retrieval import RetrievalEngine
 from .telemetry import PipelineStep, TelemetryStore
@@ -22,116 +25,170 @@ class Orchestrator:
         gatherer: Gatherer,
         provider_factory: ProviderFactory,
         telemetry: TelemetryStore,
+        answer_cache: AnswerCache | None = None,
     ) -> None:
         self._planner = planner
         self._retrieval = retrieval
         self._gatherer = gatherer
         self._providers = provider_factory
         self._telemetry = telemetry
+        self._answers = answer_cache
         self._provider: LLMProvider | None = None
 
     def rebuild(self, config: AppConfig) -> None:
         self._planner.rebuild(config)
         if config.provider:
             self._provider = self._providers.build(config.provider)
-        self._retrieval.build()
-
-    def _make_step(
-        self, name: str, start: float, details: dict[str, Any], status: str = "completed"
-    ) -> PipelineStep:
-        """Helper to create a PipelineStep with timing."""
-        end = time.perf_counter()
-        started_at = datetime.utcnow()
-        return PipelineStep(
-            name=name,
-            started_at=started_at,
-            completed_at=datetime.utcnow(),
-            duration_ms=round((end - start) * 1000, 2),
-            details=details,
-            status=status,
-        )
 
     async def answer(self, query: str) -> dict:
-        pipeline_start = datetime.utcnow()
-        pipeline_steps: list[PipelineStep] = []
+        return (await self.answer_batch([query]))[0]
+
+    async def answer_batch(self, queries: list[str], return_exceptions: bool = False) -> list[Any]:
+        """Answer several questions, sharing one batched retrieval pass.
+
+        Every sub-query of every plan is scored in a single vectorize +
+        similarity call; generation then runs concurrently per question.
+        Results come back in input order. With `return_exceptions`, a question
+        whose generation fails yields its exception in place of a result
+        instead of failing the whole batch (as with `asyncio.gather`).
+        """
+        pipeline_start = datetime.now(UTC)
+        anchor = (pipeline_start, time.perf_counter_ns())
 
         # Step 1: Planning
-        plan_start = time.perf_counter()
-        plan = self._planner.plan(query)
-        pipeline_steps.append(self._make_step(
-            "planning",
-            plan_start,
-            {
-                "num_steps": len(plan.steps),
-                "target_tokens": plan.target_tokens,
-                "coverage_target": plan.coverage_target,
-                "queries": [s.query for s in plan.steps],
-            },
-        ))
+        plans = []
+        planning_steps: list[PipelineStep] = []
+        for query in queries:
+            plan_start = time.perf_counter_ns()
+            plan = self._planner.plan(query)
+            plans.append(plan)
+            planning_steps.append(PipelineStep.from_timings(
+                "planning",
+                plan_start,
+                time.perf_counter_ns(),
+                {
+                    "num_steps": len(plan.steps),
+                    "target_tokens": plan.target_tokens,
+                    "coverage_target": plan.coverage_target,
+                    "queries": [s.query for s in plan.steps],
+                },
+                anchor,
+            ))
 
         # Step 2: Retrieval
-        retrieval_start = time.perf_counter()
+        retrieval_start = time.perf_counter_ns()
+        if not self._retrieval.built:
+            # the index is fitted lazily; do the first fit off the event loop
+            await asyncio.to_thread(self._retrieval.ensure_built)
+        sub_queries = [step for plan in plans for step in plan.steps]
+        bundles = self._gatherer.gather_batch(
+            [step.query for step in sub_queries], [step.dense_k for step in sub_queries]
+        )
+        # Sub-queries share one batched retrieval pass, so each reports the batch duration
+        batch_ns = time.perf_counter_ns() - retrieval_start
+        # every question waited for the shared pass, so each gets one sample,
+        # keeping the stage histograms per question like "generate"
+        retrieve_latency = QUERY_LATENCY.labels(stage="retrieve")
+        for _ in queries:
+            retrieve_latency.observe(batch_ns / 1e9)
+        batch_ms = round(batch_ns / 1e6, 2)
+
+        offsets = [0]
+        for plan in plans:
+            offsets.append(offsets[-1] + len(plan.steps))
+        return list(await asyncio.gather(*(
+            self._complete(
+                query,
+                plan,
+                planning_step,
+                bundles[offsets[i]:offsets[i + 1]],
+                retrieval_start,
+                batch_ms,
+                anchor,
+            )
+            for i, (query, plan, planning_step) in enumerate(zip(queries, plans, planning_steps, strict=True))
+        ), return_exceptions=return_exceptions))
+
+    async def _complete(
+        self,
+        query: str,
+        plan: RetrievalPlan,
+        planning_step: PipelineStep,
+        bundles: list[EvidenceBundle],
+        retrieval_start: int,
+        batch_ms: float,
+        anchor: tuple[datetime, int],
+    ) -> dict:
+        """Finish one question: merge its evidence, generate, and record the trace."""
+        pipeline_start = anchor[0]
+        pipeline_steps = [planning_step]
         all_chunks = []
         retrieval_details: dict[str, Any] = {"sub_queries": []}
-        for step in plan.steps:
-            sub_start = time.perf_counter()
-            step_evidence = self._gatherer.gather(step.query, top_k=step.dense_k)
+        for step, step_evidence in zip(plan.steps, bundles, strict=True):
             all_chunks.extend(step_evidence.chunks)
             retrieval_details["sub_queries"].append({
                 "query": step.query,
                 "top_k": step.dense_k,
                 "chunks_found": len(step_evidence.chunks),
-                "duration_ms": round((time.perf_counter() - sub_start) * 1000, 2),
+                "duration_ms": batch_ms,
             })
 
-        # Deduplicate chunks by ID
-        seen = set()
-        unique_chunks = []
-        for chunk in all_chunks:
-            if chunk.id not in seen:
-                seen.add(chunk.id)
-                unique_chunks.append(chunk)
-
-        chunks = unique_chunks
+        # Deduplicate chunks by ID; dicts keep first-seen key order
+        chunks = list({chunk.id: chunk for chunk in all_chunks}.values())
         if not chunks:
             evidence = self._gatherer.gather(query, top_k=3)
             chunks = evidence.chunks
 
+        total_tokens = sum(chunk.tokens for chunk in chunks)
         retrieval_details["total_chunks"] = len(chunks)
         retrieval_details["unique_sources"] = len({c.title for c in chunks})
-        pipeline_steps.append(self._make_step("retrieval", retrieval_start, retrieval_details))
+        pipeline_steps.append(PipelineStep.from_timings(
+            "retrieval", retrieval_start, time.perf_counter_ns(), retrieval_details, anchor
+        ))
 
         # Step 3: Generation
-        gen_start = time.perf_counter()
+        gen_start = time.perf_counter_ns()
         provider = self._provider
         gen_details: dict[str, Any] = {"provider": None, "model": None}
+        # one join shared by the prompt and the no-provider summary; a list lets
+        # str.join size the result up front instead of draining a generator first
+        context = "\n\n".join([chunk.snippet for chunk in chunks])
 
         if provider is None:
-            summary = "\n\n".join(chunk.snippet for chunk in chunks)
-            answer = f"(No provider configured.) Context summary:\n{summary}" if summary else "No documents ingested yet."
+            answer = f"(No provider configured.) Context summary:\n{context}" if context else "No documents ingested yet."
             gen_details["provider"] = "none"
             gen_details["fallback"] = True
         else:
-            context = "\n\n".join(chunk.snippet for chunk in chunks)
-            messages = [
-                {"role": "system", "content": "You are JR AutoRAG assistant. Answer based on the provided context."},
-                {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {query}"},
-            ]
             gen_details["provider"] = getattr(provider, "base_url", "unknown")
             gen_details["model"] = getattr(provider, "default_model", "unknown")
-            gen_details["context_tokens"] = sum(len(c.snippet.split()) for c in chunks)
-            try:
-                answer = await provider.chat(messages)
+            gen_details["context_tokens"] = total_tokens
+            signature = AnswerCache.signature(f"{gen_details['provider']}|{gen_details['model']}", chunks)
+            hit = self._answers.lookup(query, signature) if self._answers else None
+            if hit is not None:
+                answer = hit
+                gen_details["cache"] = "exact"
                 gen_details["status"] = "success"
-            except ProviderError as exc:
-                answer = f"Provider error: {exc}"
-                gen_details["status"] = "error"
-                gen_details["error"] = str(exc)
-
-        pipeline_steps.append(self._make_step("generation", gen_start, gen_details))
+            else:
+                messages = [
+                    {"role": "system", "content": "You are JR AutoRAG assistant. Answer based on the provided context."},
+                    {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {query}"},
+                ]
+                try:
+                    answer = await provider.chat(messages)
+                    gen_details["status"] = "success"
+                    if self._answers:
+                        # appending (or compacting) answers.jsonl is file I/O; keep it off the loop
+                        await asyncio.to_thread(self._answers.store, query, signature, answer)
+                except ProviderError as exc:
+                    answer = f"Provider error: {exc}"
+                    gen_details["status"] = "error"
+                    gen_details["error"] = str(exc)
+
+        gen_end = time.perf_counter_ns()
+        QUERY_LATENCY.labels(stage="generate").observe((gen_end - gen_start) / 1e9)
+        pipeline_steps.append(PipelineStep.from_timings("generation", gen_start, gen_end, gen_details, anchor))
 
         # Calculate final metrics
-        total_tokens = sum(len(chunk.snippet.split()) for chunk in chunks)
         coverage = 0.0
         if plan.steps:
             coverage = min(1.0, len(chunks) / plan.steps[0].dense_k)
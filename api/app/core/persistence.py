@@ -0,0 +1,35 @@
+"""Filesystem helpers shared by the JSON-backed stores."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+
+try:  # pragma: no cover - optional dependency
+    from fastrlock.rlock import FastRLock as RLock  # type: ignore
+except ImportError:  # pragma: no cover
+    from threading import RLock
+
+__all__ = ["RLock", "atomic_write_bytes", "wait_for_writer"]
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` without ever exposing a partially written file.
+
+    Writes to a sibling temp file, fsyncs it once, then renames it over the
+    target so readers (and crash recovery) see either the old or new contents.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+
+
+def wait_for_writer(done: threading.Event, writer: threading.Thread) -> None:
+    """Block until `writer` sets `done`, raising instead of hanging if the thread has died."""
+    while not done.wait(1.0):
+        if not writer.is_alive():
+            raise RuntimeError(f"{writer.name} thread is not running")
@@ -29,6 +29,10 @@ class Planner:
     def __init__(self, config: AppConfig) -> None:
         self._config = config
 
+    @property
+    def config(self) -> AppConfig:
+        return self._config
+
     def rebuild(self, config: AppConfig) -> None:
         self._config = config
 
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import os
+import time
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 
 from ..schemas.config import LocalProviderInfo, ProviderConfig, ProviderKind
 
@@ -16,12 +21,54 @@ class ProviderError(RuntimeError):
     """Raised when a provider request fails."""
 
 
+_http_client: httpx.AsyncClient | None = None
+
+# HTTP/2 multiplexes concurrent calls to one provider host over a single
+# connection; it needs the optional `h2` package (httpx[http2]) and TLS
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_MAX_CONNECTIONS = int(os.environ.get("JR_HTTPX_MAX_CONN", "1000"))
+_MAX_KEEPALIVE = int(os.environ.get("JR_HTTPX_MAX_KEEPALIVE", "100"))
+
+# request and response bodies go through orjson rather than stdlib json
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled AsyncClient, creating it on first use.
+
+    Sharing one client keeps connections to provider hosts alive across
+    requests instead of paying a TCP (+TLS) handshake per call.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE,
+                keepalive_expiry=30.0,
+            ),
+            http2=_HTTP2,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class LLMProvider:
     """Minimal interface for chat/complete operations."""
 
-    def __init__(self, base_url: str, default_model: str | None = None) -> None:
+    def __init__(
+        self, base_url: str, default_model: str | None = None, client: httpx.AsyncClient | None = None
+    ) -> None:
         self.base_url = str(base_url).rstrip("/")
         self.default_model = default_model
+        self._client = client
 
     async def chat(self, messages: Iterable[dict[str, Any]], **kwargs: Any) -> str:
         raise NotImplementedError
@@ -34,18 +81,26 @@ class _HTTPProvider(LLMProvider):
     """Shared utilities for HTTP based providers."""
 
     endpoint: str = ""
+    label: str = "Provider"
+
+    def _headers(self) -> dict[str, str] | None:
+        return None
 
     async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
         url = f"{self.base_url}{path}"
+        client = self._client or get_http_client()
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
+            response = await client.post(
+                url, content=orjson.dumps(payload), headers={**_JSON_HEADERS, **(self._headers() or {})}
+            )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as exc:
-            raise ProviderError(f"Provider error {exc.response.status_code}: {exc}") from exc
+            raise ProviderError(f"{self.label} error {exc.response.status_code}: {exc}") from exc
         except httpx.HTTPError as exc:
-            raise ProviderError(f"Provider request failed: {exc}") from exc
+            raise ProviderError(f"{self.label} request failed: {exc}") from exc
+        except orjson.JSONDecodeError as exc:
+            raise ProviderError(f"{self.label} returned invalid JSON") from exc
 
 
 class OllamaProvider(_HTTPProvider):
@@ -83,22 +138,21 @@ class LMStudioProvider(_HTTPProvider):
 
 
 class CloudProvider(_HTTPProvider):
-    def __init__(self, base_url: str, default_model: str | None = None, api_key: str | None = None) -> None:
-        super().__init__(base_url, default_model)
+    label = "Cloud provider"
+
+    def __init__(
+        self,
+        base_url: str,
+        default_model: str | None = None,
+        api_key: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        super().__init__(base_url, default_model, client)
         self.api_key = api_key
 
-    async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
-        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
-        try:
-            async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-                response = await client.post(url, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as exc:
-            raise ProviderError(f"Cloud provider error {exc.response.status_code}: {exc}") from exc
-        except httpx.HTTPError as exc:
-            raise ProviderError(f"Cloud provider request failed: {exc}") from exc
+    def _headers(self) -> dict[str, str] | None:
+        # per-request auth so the shared client can serve every endpoint
+        return {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
 
     async def chat(self, messages: Iterable[dict[str, Any]], **kwargs: Any) -> str:
         model = kwargs.get("model") or self.default_model or "gpt-4o-mini"
@@ -115,6 +169,17 @@ class CloudProvider(_HTTPProvider):
         return choices[0].get("text", "") if choices else ""
 
 
+@lru_cache(maxsize=64)
+def _resolve_kind(name: str | None) -> ProviderKind:
+    """Map a free-form provider name to its `ProviderKind`, memoized per name."""
+    lowered = (name or "").lower()
+    if "ollama" in lowered:
+        return ProviderKind.OLLAMA
+    if "lm" in lowered or "studio" in lowered:
+        return ProviderKind.LM_STUDIO
+    return ProviderKind.OPENAI_COMPAT
+
+
 @dataclass
 class ProviderFactory:
     """Build provider clients based on `ProviderConfig`."""
@@ -122,72 +187,103 @@ class ProviderFactory:
     api_key: str | None = None
 
     def build(self, cfg: ProviderConfig) -> LLMProvider:
-        name = (cfg.name or "").lower()
-        if "ollama" in name:
-            return OllamaProvider(str(cfg.base_url), cfg.planner_model or cfg.generator_model)
-        if "lm" in name or "studio" in name:
-            return LMStudioProvider(str(cfg.base_url), cfg.generator_model)
+        return _BUILDERS[_resolve_kind(cfg.name)](self, cfg)
+
+    def _build_ollama(self, cfg: ProviderConfig) -> LLMProvider:
+        return OllamaProvider(str(cfg.base_url), cfg.planner_model or cfg.generator_model)
+
+    def _build_lmstudio(self, cfg: ProviderConfig) -> LLMProvider:
+        return LMStudioProvider(str(cfg.base_url), cfg.generator_model)
+
+    def _build_cloud(self, cfg: ProviderConfig) -> LLMProvider:
         return CloudProvider(str(cfg.base_url), cfg.generator_model, api_key=cfg.api_key or self.api_key)
 
 
-async def discover_models(cfg: ProviderConfig) -> list[str]:
+_BUILDERS = {
+    ProviderKind.OLLAMA: ProviderFactory._build_ollama,
+    ProviderKind.LM_STUDIO: ProviderFactory._build_lmstudio,
+    ProviderKind.OPENAI_COMPAT: ProviderFactory._build_cloud,
+}
+
+
+# model lists and versions rarely change, but the UI polls them; successful
+# GETs are reused for this many seconds, keyed on (url, authorization)
+_PROBE_TTL = 10.0
+_probe_cache: dict[tuple[str, str | None], tuple[float, Any]] = {}
+
+
+async def _get_json(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str] | None = None, timeout: float = 3.0
+) -> Any:
+    """GET `url` as JSON, serving a cached copy younger than `_PROBE_TTL`.
+
+    Failed requests are never cached and evict any stale entry. The cache is
+    only touched from the event loop, with no await between check and store.
+    """
+    key = (url, (headers or {}).get("Authorization"))
+    cached = _probe_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _PROBE_TTL:
+        return cached[1]
+    try:
+        response = await client.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        _probe_cache.pop(key, None)
+        raise
+    data = orjson.loads(response.content)
+    _probe_cache[key] = (time.monotonic(), data)
+    return data
+
+
+async def discover_models(cfg: ProviderConfig, client: httpx.AsyncClient | None = None) -> list[str]:
     """Fetch available model names for a provider."""
 
     base = str(cfg.base_url).rstrip("/")
     headers = {"Authorization": f"Bearer {cfg.api_key}"} if cfg.api_key else None
-    async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-        kind = (cfg.name or "").lower()
-        try:
-            if "ollama" in kind:
-                resp = await client.get(f"{base}/api/tags")
-                resp.raise_for_status()
-                data = resp.json()
-                return [model.get("name", "") for model in data.get("models", []) if model.get("name")]
-            if "lm" in kind or "studio" in kind:
-                resp = await client.get(f"{base}/v1/models")
-                resp.raise_for_status()
-                data = resp.json()
-                return [item.get("id", "") for item in data.get("data", []) if item.get("id")]
-            # Fallback for OpenAI-compatible clouds
-            resp = await client.get(f"{base}/v1/models")
-            resp.raise_for_status()
-            data = resp.json()
-            return [item.get("id", "") for item in data.get("data", []) if item.get("id")]
-        except httpx.HTTPError as exc:
-            raise ProviderError(f"Failed to discover models: {exc}") from exc
+    client = client or get_http_client()
+    kind = _resolve_kind(cfg.name)
+    try:
+        if kind is ProviderKind.OLLAMA:
+            data = await _get_json(client, f"{base}/api/tags", headers, timeout=15.0)
+            return [model.get("name", "") for model in data.get("models", []) if model.get("name")]
+        # LM Studio and OpenAI-compatible clouds share the /v1/models listing
+        data = await _get_json(client, f"{base}/v1/models", headers, timeout=15.0)
+        return [item.get("id", "") for item in data.get("data", []) if item.get("id")]
+    except httpx.HTTPError as exc:
+        raise ProviderError(f"Failed to discover models: {exc}") from exc
 
 
 _DEFAULT_OLLAMA_URL = os.environ.get("JR_OLLAMA_URL", "http://localhost:11434")
 _DEFAULT_LMSTUDIO_URL = os.environ.get("JR_LMSTUDIO_URL", "http://localhost:1234")
 
 
-async def _probe_ollama(base_url: str) -> LocalProviderInfo:
-    base = base_url.rstrip("/")
-    async with httpx.AsyncClient(timeout=3.0) as client:
-        try:
-            tags = await client.get(f"{base}/api/tags")
-            tags.raise_for_status()
-            data = tags.json()
-        except (httpx.HTTPError, httpx.RequestError) as exc:
-            raise ProviderError(f"Ollama tags request failed: {exc}") from exc
+def _optional(result: Any, default: Any) -> Any:
+    """Unwrap an optional probe sub-request gathered with return_exceptions=True."""
+    if isinstance(result, httpx.HTTPError):
+        return default
+    if isinstance(result, BaseException):
+        raise result
+    return result
 
-        models = [model.get("name", "") for model in data.get("models", []) if model.get("name")]
 
-        running: list[str] = []
-        try:
-            ps_resp = await client.get(f"{base}/api/ps")
-            ps_resp.raise_for_status()
-            running = [model.get("model", "") for model in ps_resp.json().get("models", []) if model.get("model")]
-        except (httpx.HTTPError, httpx.RequestError):
-            running = []
+async def _probe_ollama(base_url: str, client: httpx.AsyncClient) -> LocalProviderInfo:
+    base = base_url.rstrip("/")
+    # tags, running models and version are independent: one round-trip instead of three
+    data, ps_data, version_data = await asyncio.gather(
+        _get_json(client, f"{base}/api/tags"),
+        _get_json(client, f"{base}/api/ps"),
+        _get_json(client, f"{base}/api/version"),
+        return_exceptions=True,
+    )
+    if isinstance(data, httpx.HTTPError):
+        raise ProviderError(f"Ollama tags request failed: {data}") from data
+    if isinstance(data, BaseException):
+        raise data
 
-        version: str | None = None
-        try:
-            version_resp = await client.get(f"{base}/api/version")
-            version_resp.raise_for_status()
-            version = version_resp.json().get("version")
-        except (httpx.HTTPError, httpx.RequestError):
-            version = None
+    models = [model.get("name", "") for model in data.get("models", []) if model.get("name")]
+    ps_data = _optional(ps_data, {})
+    running = [model.get("model", "") for model in ps_data.get("models", []) if model.get("model")]
+    version: str | None = _optional(version_data, {}).get("version")
 
     return LocalProviderInfo(
         kind=ProviderKind.OLLAMA,
@@ -199,27 +295,22 @@ async def _probe_ollama(base_url: str) -> LocalProviderInfo:
     )
 
 
-async def _probe_lmstudio(base_url: str) -> LocalProviderInfo:
+async def _probe_lmstudio(base_url: str, client: httpx.AsyncClient) -> LocalProviderInfo:
     base = base_url.rstrip("/")
-    async with httpx.AsyncClient(timeout=3.0) as client:
-        try:
-            models_resp = await client.get(f"{base}/api/v0/models")
-            models_resp.raise_for_status()
-        except (httpx.HTTPError, httpx.RequestError) as exc:
-            raise ProviderError(f"LM Studio models request failed: {exc}") from exc
+    payload, version_data = await asyncio.gather(
+        _get_json(client, f"{base}/api/v0/models"),
+        _get_json(client, f"{base}/api/v0/version"),
+        return_exceptions=True,
+    )
+    if isinstance(payload, httpx.HTTPError):
+        raise ProviderError(f"LM Studio models request failed: {payload}") from payload
+    if isinstance(payload, BaseException):
+        raise payload
 
-        payload = models_resp.json()
-        entries = payload.get("data", [])
-        models = [entry.get("id", "") for entry in entries if entry.get("id")]
-        running = [entry.get("id", "") for entry in entries if entry.get("state") == "loaded" and entry.get("id")]
-
-        version: str | None = None
-        try:
-            version_resp = await client.get(f"{base}/api/v0/version")
-            version_resp.raise_for_status()
-            version = version_resp.json().get("version")
-        except (httpx.HTTPError, httpx.RequestError):
-            version = None
+    entries = payload.get("data", [])
+    models = [entry.get("id", "") for entry in entries if entry.get("id")]
+    running = [entry.get("id", "") for entry in entries if entry.get("state") == "loaded" and entry.get("id")]
+    version: str | None = _optional(version_data, {}).get("version")
 
     return LocalProviderInfo(
         kind=ProviderKind.LM_STUDIO,
@@ -231,21 +322,22 @@ async def _probe_lmstudio(base_url: str) -> LocalProviderInfo:
     )
 
 
-async def discover_local_providers() -> list[LocalProviderInfo]:
+async def discover_local_providers(client: httpx.AsyncClient | None = None) -> list[LocalProviderInfo]:
+    client = client or get_http_client()
     probes = [
-        (ProviderKind.OLLAMA, "Ollama", _DEFAULT_OLLAMA_URL, _probe_ollama),
-        (ProviderKind.LM_STUDIO, "LM Studio", _DEFAULT_LMSTUDIO_URL, _probe_lmstudio),
+        (kind, name, base, func)
+        for kind, name, base, func in (
+            (ProviderKind.OLLAMA, "Ollama", _DEFAULT_OLLAMA_URL, _probe_ollama),
+            (ProviderKind.LM_STUDIO, "LM Studio", _DEFAULT_LMSTUDIO_URL, _probe_lmstudio),
+        )
+        if base
     ]
+    # probes hit independent hosts, so total latency is the slowest probe, not the sum
+    results = await asyncio.gather(*(func(base, client) for _, _, base, func in probes), return_exceptions=True)
 
     providers: list[LocalProviderInfo] = []
-    for kind, name, base, func in probes:
-        if not base:
-            continue
-        try:
-            info = await func(base)
-            info.status = "ok"
-            providers.append(info)
-        except ProviderError as exc:
+    for (kind, name, base, _), result in zip(probes, results, strict=True):
+        if isinstance(result, ProviderError):
             providers.append(
                 LocalProviderInfo(
                     kind=kind,
@@ -254,7 +346,12 @@ async def discover_local_providers() -> list[LocalProviderInfo]:
                     models=[],
                     running=[],
                     status="error",
-                    error_message=str(exc),
+                    error_message=str(result),
                 )
             )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            result.status = "ok"
+            providers.append(result)
     return providers
@@ -0,0 +1,91 @@
+"""Micro-batching of concurrent questions into shared orchestrator passes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from .orchestrator import Orchestrator
+from .planner import Planner
+
+
+class QueryBatcher:
+    """Coalesces concurrent `/query` calls into `Orchestrator.answer_batch`.
+
+    The first queued question opens a window of `batch_wait_ms`; everything
+    that arrives before it closes (up to `batch_max` questions) is retrieved
+    in one pass. Window settings are read from the planner's current
+    `RetrievalDefaults`, so config updates apply to the next batch.
+
+    The queue and worker task belong to one event loop and are recreated
+    lazily when `submit` runs on a different loop.
+    """
+
+    def __init__(self, orchestrator: Orchestrator, planner: Planner) -> None:
+        self._orchestrator = orchestrator
+        self._planner = planner
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[dict]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[Any]] = set()
+
+    async def submit(self, question: str) -> dict:
+        queue = self._ensure_worker()
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        queue.put_nowait((question, future))
+        return await future
+
+    def _ensure_worker(self) -> asyncio.Queue[tuple[str, asyncio.Future[dict]]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[tuple[str, asyncio.Future[dict]]]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            settings = self._planner.config.retrieval
+            deadline = loop.time() + settings.batch_wait_ms / 1000
+            while len(batch) < settings.batch_max:
+                if not queue.empty():
+                    # already waiting: take it even if the window has closed
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            # answer in the background so the next window opens while this
+            # batch waits on the provider
+            task = loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future[dict]]]) -> None:
+        live = [(question, future) for question, future in batch if not future.done()]
+        if not live:
+            return
+        try:
+            # per-question failures come back as values so they only fail their own caller
+            results = await self._orchestrator.answer_batch([question for question, _ in live], return_exceptions=True)
+        except Exception as exc:
+            # planning or the shared retrieval pass failed: nobody in the batch has an answer
+            for _, future in live:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(live, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -2,81 +2,204 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any
 
+import numpy as np
+import scipy.sparse as sp
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from .documents import Document, DocumentStore
+from .persistence import RLock
 
+# removals drop rows in place; after this many the vectorizer is refitted so
+# IDF weights stop drifting from the live corpus
+_REFIT_AFTER_DELETES = 32
 
-@dataclass
+# the analyzer (token regex + English stop words) is the same for every refit,
+# so build it once instead of per vectorizer
+_ANALYZER = TfidfVectorizer(stop_words="english").build_analyzer()
+
+
+@dataclass(slots=True)
 class RetrievalResult:
     document: Document
     score: float
 
 
+@dataclass(frozen=True, slots=True)
+class _Index:
+    """One fitted TF-IDF index.
+
+    Never mutated: builds and removals publish a new instance with a single
+    attribute store, so a reader that loads it once sees a vocabulary, matrix
+    and row map that belong together.
+    """
+
+    vectorizer: TfidfVectorizer
+    matrix: sp.csr_matrix | None
+    # row_idx -> (doc_id, chunk_text)
+    chunk_map: list[tuple[str, str]]
+    id_to_doc: dict[str, Document]
+    # doc_id -> its contiguous rows in the matrix / chunk_map
+    row_ranges: dict[str, slice]
+    # cached single-query rows, valid only for this vectorizer's vocabulary
+    vectorize: Callable[[str], Any]
+
+
 class RetrievalEngine:
     """Very small retrieval engine backed by TF-IDF."""
 
     def __init__(self, documents: DocumentStore) -> None:
         self._docs = documents
-        self._vectorizer = TfidfVectorizer(stop_words="english")
-        self._matrix = None
-        # Map row_idx -> (doc_id, chunk_text)
-        self._chunk_map: list[tuple[str, str]] = []
+        # builds and removals may run concurrently in worker threads; queries
+        # never lock and instead read `_index` once per call
+        self._build_lock = RLock()
+        self._index: _Index | None = None
+        self._pending_deletes = 0
 
     def _chunk_text(self, text: str, chunk_size: int = 800) -> list[str]:
         # Simple paragraph-based chunking
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+        if not paragraphs:
+            return [text]
+        # Each chunk greedily takes paragraphs while its total length stays within
+        # chunk_size; binary search over the cumulative lengths finds each boundary,
+        # so the Python loop runs once per chunk rather than once per paragraph
+        cum = np.fromiter((len(p) for p in paragraphs), dtype=np.int64, count=len(paragraphs)).cumsum()
         chunks = []
-        current = []
-        current_len = 0
-        for p in paragraphs:
-            if current_len + len(p) > chunk_size and current:
-                chunks.append("\n".join(current))
-                current = []
-                current_len = 0
-            current.append(p)
-            current_len += len(p)
-        if current:
-            chunks.append("\n".join(current))
-        return chunks if chunks else [text]
+        lo = 0
+        while lo < len(paragraphs):
+            base = int(cum[lo - 1]) if lo else 0
+            hi = max(int(np.searchsorted(cum, base + chunk_size, side="right")), lo + 1)
+            chunks.append("\n".join(paragraphs[lo:hi]))
+            lo = hi
+        return chunks
+
+    @staticmethod
+    def _new_vectorizer() -> TfidfVectorizer:
+        # float32 halves the CSR matrix and the bytes the query dot product scans
+        return TfidfVectorizer(analyzer=_ANALYZER, dtype=np.float32, sublinear_tf=True, norm="l2")
 
     def build(self) -> None:
-        corpus = []
-        self._chunk_map = []
-
-        for doc in self._docs.list():
-            chunks = self._chunk_text(doc.text)
-            for chunk in chunks:
-                corpus.append(chunk)
-                self._chunk_map.append((doc.id, chunk))
-
-        if corpus:
-            self._matrix = self._vectorizer.fit_transform(corpus)
-        else:
-            self._matrix = None
+        with self._build_lock:
+            corpus = []
+            chunk_map: list[tuple[str, str]] = []
+            row_ranges: dict[str, slice] = {}
+            docs = self._docs.list()
+
+            for doc in docs:
+                chunks = self._chunk_text(doc.text)
+                start = len(corpus)
+                corpus.extend(chunks)
+                chunk_map.extend((doc.id, chunk) for chunk in chunks)
+                row_ranges[doc.id] = slice(start, len(corpus))
+
+            # fit a fresh vectorizer so concurrent queries keep using the old
+            # index until the new one is published below
+            vectorizer = self._new_vectorizer()
+            # rows are L2-normalized, so a plain dot product is the cosine similarity
+            matrix = vectorizer.fit_transform(corpus).tocsr() if corpus else None
+
+            self._pending_deletes = 0
+            self._index = _Index(
+                vectorizer=vectorizer,
+                matrix=matrix,
+                chunk_map=chunk_map,
+                id_to_doc={doc.id: doc for doc in docs},
+                row_ranges=row_ranges,
+                vectorize=lru_cache(maxsize=512)(lambda text: vectorizer.transform([text])),
+            )
+
+    @property
+    def built(self) -> bool:
+        return self._index is not None
+
+    def ensure_built(self) -> None:
+        """Fit the index on first use; afterwards this is an attribute check."""
+        if self._index is None:
+            with self._build_lock:
+                if self._index is None:
+                    self.build()
+
+    def remove(self, doc_id: str) -> None:
+        """Drop a deleted document's rows from the index without refitting.
+
+        IDF weights keep the removed document's contribution until the next
+        full `build()`, which runs automatically after `_REFIT_AFTER_DELETES`
+        removals.
+        """
+        with self._build_lock:
+            index = self._index
+            rows = index.row_ranges.get(doc_id) if index is not None else None
+            if rows is None or index.matrix is None:
+                return
+            self._pending_deletes += 1
+            if self._pending_deletes >= _REFIT_AFTER_DELETES:
+                self.build()
+                return
+            keep = np.ones(index.matrix.shape[0], dtype=bool)
+            keep[rows] = False
+            width = rows.stop - rows.start
+            # same vocabulary, so the cached query rows stay valid
+            self._index = replace(
+                index,
+                matrix=index.matrix[keep] if keep.any() else None,
+                chunk_map=index.chunk_map[: rows.start] + index.chunk_map[rows.stop :],
+                id_to_doc={other: doc for other, doc in index.id_to_doc.items() if other != doc_id},
+                row_ranges={
+                    other: span if span.start < rows.stop else slice(span.start - width, span.stop - width)
+                    for other, span in index.row_ranges.items()
+                    if other != doc_id
+                },
+            )
 
     def query(self, text: str, top_k: int = 5) -> list[RetrievalResult]:
-        if self._matrix is None:
-            self.build()
-        if self._matrix is None or not text.strip():
-            return []
-
-        query_vec = self._vectorizer.transform([text])
-        scores = cosine_similarity(query_vec, self._matrix).flatten()
-
-        # Get top indices
-        top_indices = scores.argsort()[::-1][:top_k]
+        return self.query_batch([text], [top_k])[0]
+
+    def query_batch(self, texts: list[str], top_ks: list[int]) -> list[list[RetrievalResult]]:
+        """Score several queries against the index with one vectorize + similarity call."""
+        self.ensure_built()
+        # one load: a concurrent build or removal publishes a new index instead
+        # of changing this one underneath us
+        index = self._index
+        batch: list[list[RetrievalResult]] = [[] for _ in texts]
+        live = [i for i, text in enumerate(texts) if text.strip()]
+        if index is None or index.matrix is None or not live:
+            return batch
+
+        query_vecs = sp.vstack([index.vectorize(texts[i]) for i in live], format="csr")
+        # float32 halves the bytes the top-k selection has to scan
+        scores = (query_vecs @ index.matrix.T).toarray().astype(np.float32, copy=False)
+
+        # Top indices for every query at once: one row-wise O(N) partition to the
+        # largest k requested, then sort only those k columns per row
+        k = min(max(top_ks[i] for i in live), scores.shape[1])
+        if k <= 0:
+            return batch
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        top_indices = np.take_along_axis(part, order, axis=1)
+        top_scores = np.take_along_axis(part_scores, order, axis=1)
+        for row, i in enumerate(live):
+            limit = max(min(top_ks[i], k), 0)
+            batch[i] = self._top_results(top_indices[row, :limit], top_scores[row, :limit], index)
+        return batch
+
+    def _top_results(self, top_indices: np.ndarray, top_scores: np.ndarray, index: _Index) -> list[RetrievalResult]:
+        # drop non-matching rows in numpy and hand the loop plain Python ints/floats
+        matched = top_scores > 0
+        chunk_map = index.chunk_map
+        id_to_doc = index.id_to_doc
 
         results: list[RetrievalResult] = []
-        id_to_doc = {doc.id: doc for doc in self._docs.list()}
 
-        for idx in top_indices:
-            score = float(scores[idx])
-            if score > 0 and idx < len(self._chunk_map):
-                doc_id, chunk_text = self._chunk_map[idx]
+        for idx, score in zip(top_indices[matched].tolist(), top_scores[matched].tolist(), strict=True):
+            if idx < len(chunk_map):
+                doc_id, chunk_text = chunk_map[idx]
                 doc = id_to_doc.get(doc_id)
                 if doc:
                     # Create a transient document representing this chunk
@@ -3,16 +3,62 @@
 from __future__ import annotations
 
 import builtins
-import json
+import mmap
+import os
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from threading import RLock
 from typing import Any
 
+import orjson
 
-@dataclass
+from .persistence import atomic_write_bytes, wait_for_writer
+
+# orjson writes dataclasses and datetimes natively; naive datetimes are tagged UTC,
+# and numpy scores/arrays left in free-form step details serialize without a
+# Python-side conversion pass
+_DUMP_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+# rewrite the log down to the retained tail once it grows past this size
+_ROTATE_BYTES = 64 << 20
+# the writer thread writes and syncs buffered lines once this many are pending
+# or this many seconds pass; telemetry accepts that small durability window
+_FLUSH_BATCH = 32
+_FLUSH_INTERVAL = 0.1
+# fdatasync skips the metadata-only inode updates; not every platform has it
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _read_tail(path: Path, count: int) -> tuple[builtins.list[bytes], bool]:
+    """Return the last `count` lines of `path` and whether they cover the whole file.
+
+    Scans backwards over an mmap of the file, so startup cost depends on the
+    retained tail rather than the log size.
+    """
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if not size:
+            return [], True
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = size - 1 if mm[size - 1 : size] == b"\n" else size
+            lines: builtins.list[bytes] = []
+            while len(lines) < count:
+                start = mm.rfind(b"\n", 0, pos)
+                lines.append(mm[start + 1 : pos])
+                if start == -1:
+                    return lines[::-1], True
+                pos = start
+            return lines[::-1], False
+
+
+@dataclass(slots=True)
 class PipelineStep:
     """A single step in the RAG pipeline with timing and details."""
     name: str
@@ -22,8 +68,33 @@ class PipelineStep:
     details: dict[str, Any] = field(default_factory=dict)
     status: str = "completed"
 
+    @classmethod
+    def from_timings(
+        cls,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        details: dict[str, Any],
+        anchor: tuple[datetime, int],
+        status: str = "completed",
+    ) -> PipelineStep:
+        """Build a step from `perf_counter_ns` readings.
 
-@dataclass
+        Wall-clock timestamps are derived from the trace's `(wall, perf_ns)`
+        anchor instead of reading the system clock per step.
+        """
+        wall, base_ns = anchor
+        return cls(
+            name=name,
+            started_at=wall + timedelta(microseconds=(start_ns - base_ns) / 1000),
+            completed_at=wall + timedelta(microseconds=(end_ns - base_ns) / 1000),
+            duration_ms=round((end_ns - start_ns) / 1e6, 2),
+            details=details,
+            status=status,
+        )
+
+
+@dataclass(slots=True)
 class Trace:
     id: str
     started_at: datetime
@@ -34,15 +105,61 @@ class Trace:
     steps: list[PipelineStep] = field(default_factory=list)
 
 
+class _Rotate:
+    """Writer-queue marker asking for the log to be replaced by `payload`."""
+
+    def __init__(self, payload: bytes) -> None:
+        self.payload = payload
+
+
 class TelemetryStore:
-    def __init__(self, path: Path | None = None) -> None:
-        self._path = Path(path or Path.cwd() / "data" / "traces.json")
+    """Trace history persisted as JSON Lines, one trace appended per `record()`.
+
+    Only the newest `max_traces` traces are kept in memory; once the log holds
+    twice that many lines, or exceeds 64 MiB, it is rewritten down to the
+    retained tail.
+
+    Writes happen on a background thread that coalesces lines into one
+    buffered write and fdatasync per batch, so `record()` never touches the
+    disk. A failed write is re-raised from the next `record()` or `flush()`,
+    which also queues a rewrite of the log from the retained traces.
+    """
+
+    def __init__(self, path: Path | None = None, max_traces: int = 10_000) -> None:
+        self._path = Path(path or Path.cwd() / "data" / "traces.jsonl")
         self._lock = RLock()
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._traces: list[Trace] = []
+        self._max_traces = max_traces
+        self._traces: deque[Trace] = deque(maxlen=max_traces)
+        self._log_lines = 0
+        self._log_bytes = 0
+        # size of the log right after the last rewrite (the retained tail)
+        self._tail_bytes = 0
+        legacy = self._path.with_suffix(".json")
         if self._path.exists():
-            raw = json.loads(self._path.read_text(encoding="utf-8"))
-            self._traces = [self._decode(item) for item in raw]
+            # older lines would fall straight out of the deque; never read them
+            lines, whole = _read_tail(self._path, max_traces)
+            # a log longer than the tail has unknown length: compact on the next append
+            self._log_lines = len(lines) if whole else 2 * max_traces
+            self._log_bytes = self._path.stat().st_size
+            for line in lines:
+                try:
+                    self._traces.append(self._decode(orjson.loads(line)))
+                except (orjson.JSONDecodeError, KeyError):
+                    # torn tail from an interrupted write
+                    continue
+        elif legacy.exists():
+            raw = orjson.loads(legacy.read_bytes())
+            self._traces.extend(self._decode(item) for item in raw[-max_traces:])
+            payload = self._tail_payload()
+            atomic_write_bytes(self._path, payload)
+            self._log_lines, self._log_bytes = len(self._traces), len(payload)
+            self._tail_bytes = len(payload)
+        self._handle = self._path.open("ab")
+        self._queue: SimpleQueue[Any] = SimpleQueue()
+        self._error: OSError | None = None
+        self._writer = threading.Thread(target=self._drain, name="telemetry-writer", daemon=True)
+        self._writer.start()
 
     def _decode_step(self, data: dict[str, Any]) -> PipelineStep:
         return PipelineStep(
@@ -66,21 +183,96 @@ class TelemetryStore:
             steps=steps,
         )
 
-    def _persist(self) -> None:
-        payload = []
-        for trace in self._traces:
-            data = asdict(trace)
-            data["started_at"] = trace.started_at.isoformat()
-            data["completed_at"] = trace.completed_at.isoformat()
-            # Serialize steps with ISO timestamps
-            data["steps"] = []
-            for step in trace.steps:
-                step_data = asdict(step)
-                step_data["started_at"] = step.started_at.isoformat()
-                step_data["completed_at"] = step.completed_at.isoformat()
-                data["steps"].append(step_data)
-            payload.append(data)
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    @staticmethod
+    def _encode(trace: Trace) -> bytes:
+        return orjson.dumps(trace, option=_DUMP_OPTIONS) + b"\n"
+
+    def _tail_payload(self) -> bytes:
+        return b"".join(self._encode(trace) for trace in self._traces)
+
+    def _append(self, trace: Trace) -> None:
+        """Queue one trace line; callers hold `self._lock` so log order matches memory."""
+        line = self._encode(trace)
+        self._log_lines += 1
+        self._log_bytes += len(line)
+        # when the retained tail alone exceeds the byte cap, wait for the log to
+        # double before rewriting, or every append would trigger a rotation
+        if self._log_lines > 2 * self._max_traces or self._log_bytes > max(_ROTATE_BYTES, 2 * self._tail_bytes):
+            self._rotate()
+            return
+        self._queue.put(line)
+
+    def _rotate(self) -> None:
+        """Queue a rewrite of the log holding only the traces still kept in memory."""
+        payload = self._tail_payload()
+        self._log_lines, self._log_bytes = len(self._traces), len(payload)
+        self._tail_bytes = len(payload)
+        self._queue.put(_Rotate(payload))
+
+    def _raise_write_error(self) -> None:
+        """Re-raise a failed background write; the queued rotation repairs the log."""
+        exc = self._error
+        if exc is not None:
+            with self._lock:
+                self._rotate()
+            raise exc
+
+    def _drain(self) -> None:
+        pending = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=_FLUSH_INTERVAL) if pending else self._queue.get()
+            except Empty:
+                # idle with lines buffered: flush them as if asked to
+                item = threading.Event()
+            if item is None:
+                break
+            try:
+                if isinstance(item, threading.Event):
+                    if self._error is None:
+                        self._sync()
+                    pending, last_flush = 0, time.monotonic()
+                elif isinstance(item, _Rotate):
+                    with suppress(OSError):
+                        self._handle.close()
+                    atomic_write_bytes(self._path, item.payload)
+                    self._handle = self._path.open("ab")
+                    pending, last_flush = 0, time.monotonic()
+                    self._error = None
+                elif self._error is None:
+                    # after a failure, drop lines until a rotation rewrites the log
+                    self._handle.write(item)
+                    pending += 1
+                    if pending >= _FLUSH_BATCH or time.monotonic() - last_flush >= _FLUSH_INTERVAL:
+                        self._sync()
+                        pending, last_flush = 0, time.monotonic()
+            except OSError as exc:
+                self._error = exc
+                pending = 0
+            finally:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _sync(self) -> None:
+        self._handle.flush()
+        _datasync(self._handle.fileno())
+
+    def flush(self) -> None:
+        """Block until every queued trace has been written and synced to disk."""
+        done = threading.Event()
+        self._queue.put(done)
+        wait_for_writer(done, self._writer)
+        self._raise_write_error()
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._writer.join()
+            with suppress(OSError):
+                self._handle.close()
 
     def record(
         self,
@@ -90,8 +282,9 @@ class TelemetryStore:
         steps: builtins.list[PipelineStep] | None = None,
         started_at: datetime | None = None,
     ) -> Trace:
+        self._raise_write_error()
         with self._lock:
-            now = datetime.utcnow()
+            now = datetime.now(UTC)
             trace = Trace(
                 id=str(uuid.uuid4()),
                 started_at=started_at or now,
@@ -102,9 +295,35 @@ class TelemetryStore:
                 steps=steps or [],
             )
             self._traces.append(trace)
-            self._persist()
+            self._append(trace)
             return trace
 
     def list(self) -> builtins.list[Trace]:
         with self._lock:
             return list(self._traces)
+
+    def summaries(self, limit: int | None = 100, include_steps: bool = False) -> builtins.list[dict[str, Any]]:
+        """Project the newest `limit` traces (oldest first) into `TraceOut`-shaped dicts.
+
+        Steps are only materialized when `include_steps` is set, since list
+        views never show them.
+        """
+        with self._lock:
+            start = 0 if limit is None else max(len(self._traces) - limit, 0)
+            traces = builtins.list(islice(self._traces, start, None))
+        rows = []
+        for trace in traces:
+            row: dict[str, Any] = {
+                "id": trace.id,
+                "prompt": trace.prompt,
+                "answer": trace.answer,
+                "metrics": trace.metrics,
+                "steps": [
+                    {"name": s.name, "duration_ms": s.duration_ms, "details": s.details, "status": s.status}
+                    for s in trace.steps
+                ]
+                if include_steps
+                else [],
+            }
+            rows.append(row)
+        return rows
@@ -0,0 +1,52 @@
+"""Text helpers on the retrieval/generation hot path."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:  # pragma: no cover - optional accelerator
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore
+
+
+if njit is not None:  # pragma: no cover - exercised only when numba is installed
+
+    @njit(cache=True)
+    def _count_words_kernel(buf: np.ndarray) -> int:
+        # count whitespace -> non-whitespace transitions over the UTF-8 bytes
+        count = 0
+        in_word = False
+        for i in range(buf.shape[0]):
+            is_word = buf[i] > 32
+            count += is_word and not in_word
+            in_word = is_word
+        return count
+
+
+# below this length str.split() beats the fixed overhead of the numpy/Numba round-trip
+_VECTORIZE_MIN_CHARS = 1024
+
+
+def _count_words_numpy(buf: np.ndarray) -> int:
+    # SIMD-vectorized transition count: a word starts wherever a non-space
+    # byte follows a space byte (or opens the buffer)
+    if not buf.size:
+        return 0
+    is_word = buf > 32
+    return int(is_word[0]) + int(np.count_nonzero(is_word[1:] & ~is_word[:-1]))
+
+
+def count_words(text: str) -> int:
+    """Approximate token count: the number of whitespace-separated words.
+
+    Short texts use `len(text.split())`. Long ones are scanned by a compiled
+    Numba kernel when numba is installed, or a vectorized numpy scan
+    otherwise. The byte-level paths treat only ASCII whitespace as a separator.
+    """
+    if len(text) < _VECTORIZE_MIN_CHARS:
+        return len(text.split())
+    buf = np.frombuffer(text.encode("utf-8", "ignore"), dtype=np.uint8)
+    if njit is not None:
+        return int(_count_words_kernel(buf))
+    return _count_words_numpy(buf)
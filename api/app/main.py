@@ -1,9 +1,46 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from .core.providers import close_http_client, discover_local_providers, get_http_client
 from .routers import config, documents, evaluation, health, monitoring, providers, query
+from .services import ServiceContainer
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_fastapi_instrumentator import Instrumentator  # type: ignore
+except ImportError:  # pragma: no cover
+    Instrumentator = None  # type: ignore
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with AsyncExitStack() as shutdown:
+        # one pooled HTTP client per process, shared by every provider call
+        app.state.http_client = get_http_client()
+        shutdown.push_async_callback(close_http_client)
+        container = ServiceContainer()
+        # callbacks run in reverse and each runs even if an earlier one raises,
+        # so a failed store flush cannot leave the other stores open
+        shutdown.callback(container.telemetry.close)
+        shutdown.callback(container.document_store.close)
+        # fit the TF-IDF index before serving so the first query is not the one to pay for it
+        await container.warm()
+        app.state.container = container
+        # probe local runtimes in the background so the pool already holds warm
+        # connections (and the probe cache is filled) before the dashboard asks
+        warmup = asyncio.create_task(discover_local_providers(app.state.http_client))
+        yield
+        warmup.cancel()
+        # a cancelled or failed probe is expected here; interrupts still propagate
+        with suppress(asyncio.CancelledError, Exception):
+            await warmup
+
 
-app = FastAPI(title="JR AutoRAG API", version="0.1.0")
+# orjson renders every JSON response instead of the stdlib encoder
+app = FastAPI(title="JR AutoRAG API", version="0.1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS for local dev (web runs on 5173 by default)
 app.add_middleware(
@@ -22,7 +59,27 @@ app.include_router(evaluation.router)
 app.include_router(monitoring.router)
 app.include_router(providers.router)
 
+# per-endpoint request counters and latency histograms, scraped from /metrics
+if Instrumentator is not None:
+    Instrumentator().instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
+
 
 @app.get("/")
 def root():
     return {"name": "JR AutoRAG API", "status": "ok", "version": app.version}
+
+
+if __name__ == "__main__":
+    import importlib.util
+
+    import uvicorn
+
+    # uvloop and httptools ship with uvicorn[standard] (uvloop is not available on Windows)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        interface="asgi3",
+    )
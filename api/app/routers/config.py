@@ -1,5 +1,5 @@
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from ..core.providers import ProviderError, discover_models
 from ..schemas.config import RETRIEVAL_PRESETS, AppConfig, ProviderConfig, RetrievalDefaults
@@ -33,9 +33,9 @@ def update_config(
 
 
 @router.post("/models", response_model=list[str])
-async def list_models(payload: ProviderConfig):
+async def list_models(payload: ProviderConfig, request: Request):
     try:
-        models = await discover_models(payload)
+        models = await discover_models(payload, getattr(request.app.state, "http_client", None))
         return models
     except ProviderError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
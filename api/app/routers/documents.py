@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 
-from ..schemas.documents import DocumentOut, IngestResponse, IngestTextRequest
+from ..schemas.documents import BulkIngestTextRequest, DocumentOut, IngestResponse, IngestTextRequest
 from ..services import ServiceContainer, get_container
 
 router = APIRouter(prefix="/documents", tags=["documents"])
@@ -12,25 +14,54 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 
 @router.get("", response_model=list[DocumentOut])
 def list_documents(container: ServiceContainer = Depends(get_container)):
-    docs = container.document_store.list()
-    return [DocumentOut(id=doc.id, title=doc.title, text=doc.text, metadata=doc.metadata) for doc in docs]
+    # plain dicts are validated once against the response model; returning
+    # DocumentOut instances would build, dump and re-validate every document
+    return [
+        {"id": doc.id, "title": doc.title, "text": doc.text, "metadata": doc.metadata}
+        for doc in container.document_store.list()
+    ]
 
 
 @router.post("/text", response_model=IngestResponse)
-def ingest_text(payload: IngestTextRequest, container: ServiceContainer = Depends(get_container)):
+async def ingest_text(payload: IngestTextRequest, container: ServiceContainer = Depends(get_container)):
     try:
-        result = container.ingest.ingest_text(title=payload.title, text=payload.text, metadata=payload.metadata)
+        # ingestion refits the TF-IDF index; keep that CPU work off the event loop
+        result = await asyncio.to_thread(
+            container.ingest.ingest_text, title=payload.title, text=payload.text, metadata=payload.metadata
+        )
         return IngestResponse(document_id=result.document_id, title=result.title, chunk_count=result.chunk_count)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@router.post("/bulk", response_model=list[IngestResponse])
+async def ingest_text_bulk(payload: BulkIngestTextRequest, container: ServiceContainer = Depends(get_container)):
+    def run() -> list[IngestResponse]:
+        # store every document first, then refit the index once for the whole batch
+        try:
+            results = [
+                container.ingest.ingest_text(
+                    title=item.title, text=item.text, metadata=item.metadata, rebuild_index=False
+                )
+                for item in payload.items
+            ]
+        finally:
+            container.retrieval_engine.build()
+        return [IngestResponse(document_id=r.document_id, title=r.title, chunk_count=r.chunk_count) for r in results]
+
+    try:
+        return await asyncio.to_thread(run)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.delete("/{document_id}", status_code=204)
-def delete_document(document_id: str, container: ServiceContainer = Depends(get_container)):
+async def delete_document(document_id: str, container: ServiceContainer = Depends(get_container)):
     if not container.document_store.get(document_id):
         raise HTTPException(status_code=404, detail="Document not found")
     container.document_store.delete(document_id)
-    container.retrieval_engine.build()
+    # removal may trigger a periodic full refit
+    await asyncio.to_thread(container.retrieval_engine.remove, document_id)
 
 
 @router.post("/upload", response_model=IngestResponse)
@@ -40,13 +71,40 @@ async def ingest_file(
     container: ServiceContainer = Depends(get_container),
 ):
     try:
-        content = await file.read()
         filename = file.filename or "untitled"
-        result = container.ingest.ingest_file(
+        # parse straight from the spooled upload in a worker thread instead of
+        # reading it into memory on the event loop
+        result = await asyncio.to_thread(
+            container.ingest.ingest_stream,
             title=title or filename,
-            content=content,
+            fileobj=file.file,
             metadata={"filename": filename},
         )
         return IngestResponse(document_id=result.document_id, title=result.title, chunk_count=result.chunk_count)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post("/upload/bulk", response_model=list[IngestResponse])
+async def ingest_files_bulk(
+    files: list[UploadFile] = File(...),
+    container: ServiceContainer = Depends(get_container),
+):
+    def run() -> list[IngestResponse]:
+        try:
+            results = []
+            for file in files:
+                filename = file.filename or "untitled"
+                results.append(
+                    container.ingest.ingest_stream(
+                        title=filename, fileobj=file.file, metadata={"filename": filename}, rebuild_index=False
+                    )
+                )
+        finally:
+            container.retrieval_engine.build()
+        return [IngestResponse(document_id=r.document_id, title=r.title, chunk_count=r.chunk_count) for r in results]
+
+    try:
+        return await asyncio.to_thread(run)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -1,28 +1,105 @@
-"""Evaluation endpoints (simple sequential runner)."""
+"""Evaluation endpoints (concurrent runner)."""
 
 from __future__ import annotations
 
+import asyncio
+import os
+from collections.abc import AsyncIterator
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ..schemas.evaluation import EvaluationRequest, EvaluationRun
 from ..services import ServiceContainer, get_container
 
 router = APIRouter(prefix="/evaluation", tags=["evaluation"])
 
+# cap on questions in flight at once, so a large run does not exceed what the
+# provider serves in parallel (e.g. OLLAMA_NUM_PARALLEL)
+_EVAL_CONCURRENCY = int(os.environ.get("JR_EVAL_CONCURRENCY", "8"))
+
 
 @router.post("", response_model=EvaluationRun)
 async def run_evaluation(payload: EvaluationRequest, container: ServiceContainer = Depends(get_container)):
     if not payload.questions:
         raise HTTPException(status_code=400, detail="Must supply at least one question")
-    responses = []
-    for question in payload.questions:
-        result = await container.orchestrator.answer(question)
-        responses.append(result)
-    avg_coverage = sum(r["metrics"].get("coverage", 0.0) for r in responses) / len(responses)
-    avg_tokens = sum(r["metrics"].get("tokens", 0.0) for r in responses) / len(responses)
+    semaphore = asyncio.Semaphore(_EVAL_CONCURRENCY)
+    coverage_total = tokens_total = 0.0
+
+    async def answer(question: str) -> dict:
+        nonlocal coverage_total, tokens_total
+        async with semaphore:
+            result = await container.orchestrator.answer(question)
+        # fold each result into the running sums as it completes
+        metrics = result["metrics"]
+        coverage_total += metrics.get("coverage", 0.0)
+        tokens_total += metrics.get("tokens", 0.0)
+        return result
+
+    # gather returns results in question order
+    responses = await asyncio.gather(*(answer(question) for question in payload.questions))
+    avg_coverage = coverage_total / len(responses)
+    avg_tokens = tokens_total / len(responses)
     return EvaluationRun(
         name=payload.name,
         responses=responses,
         average_coverage=avg_coverage,
         average_tokens=avg_tokens,
     )
+
+
+@router.post("/stream")
+async def stream_evaluation(payload: EvaluationRequest, container: ServiceContainer = Depends(get_container)):
+    """Run an evaluation, streaming each answer as NDJSON as soon as it completes.
+
+    Response lines are `{"type": "response", "index": i, "response": {...}}`
+    in completion order; a question that fails yields
+    `{"type": "error", "index": i, "detail": "..."}` instead. One
+    `{"type": "summary", ...}` line, averaged over the answered questions,
+    always comes last.
+    """
+    if not payload.questions:
+        raise HTTPException(status_code=400, detail="Must supply at least one question")
+    semaphore = asyncio.Semaphore(_EVAL_CONCURRENCY)
+
+    async def answer(index: int, question: str) -> tuple[int, dict | Exception]:
+        async with semaphore:
+            try:
+                return index, await container.orchestrator.answer(question)
+            except Exception as exc:
+                # one bad question must not end the stream for the rest
+                return index, exc
+
+    async def lines() -> AsyncIterator[bytes]:
+        tasks = [asyncio.create_task(answer(i, q)) for i, q in enumerate(payload.questions)]
+        coverage_total = tokens_total = 0.0
+        answered = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                if isinstance(result, Exception):
+                    detail = str(result) or type(result).__name__
+                    yield orjson.dumps({"type": "error", "index": index, "detail": detail}) + b"\n"
+                    continue
+                answered += 1
+                metrics = result["metrics"]
+                coverage_total += metrics.get("coverage", 0.0)
+                tokens_total += metrics.get("tokens", 0.0)
+                yield orjson.dumps({"type": "response", "index": index, "response": result}) + b"\n"
+        finally:
+            # client went away: stop the remaining work
+            for task in tasks:
+                task.cancel()
+        count = max(answered, 1)
+        summary = {
+            "type": "summary",
+            "name": payload.name,
+            "answered": answered,
+            "failed": len(tasks) - answered,
+            "average_coverage": coverage_total / count,
+            "average_tokens": tokens_total / count,
+        }
+        yield orjson.dumps(summary) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
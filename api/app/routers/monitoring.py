@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 
 from ..schemas.query import TraceOut
 from ..services import ServiceContainer, get_container
@@ -10,7 +11,12 @@ from ..services import ServiceContainer, get_container
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 
 
-@router.get("/traces", response_model=list[TraceOut])
-def traces(container: ServiceContainer = Depends(get_container)):
-    traces = container.telemetry.list()
-    return [TraceOut(id=trace.id, prompt=trace.prompt, answer=trace.answer, metrics=trace.metrics) for trace in traces]
+@router.get("/traces", response_model=list[TraceOut], response_class=ORJSONResponse)
+async def traces(
+    container: ServiceContainer = Depends(get_container),
+    limit: int | None = Query(default=None, ge=1, description="Only the newest N traces (default: all retained)"),
+):
+    # rows are already TraceOut-shaped JSON values; returning a Response skips
+    # re-validating every trace (response_model still documents the shape).
+    # The store is served from memory, so this runs inline on the event loop.
+    return ORJSONResponse(content=container.telemetry.summaries(limit=limit))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from ..core.providers import discover_local_providers
 from ..schemas.config import LocalProviderInfo
@@ -11,17 +11,15 @@ router = APIRouter(prefix="/providers", tags=["providers"])
 
 
 @router.get("/local", response_model=list[LocalProviderInfo])
-async def list_local_providers() -> list[LocalProviderInfo]:
+async def list_local_providers(request: Request) -> list[LocalProviderInfo]:
+    # dashboard polling is absorbed by the probe cache in core.providers, which
+    # keeps successful responses briefly and never caches a failed probe
     try:
-        providers = await discover_local_providers()
+        providers = await discover_local_providers(getattr(request.app.state, "http_client", None))
     except Exception as exc:  # pragma: no cover - unexpected runtime failures
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     if not providers:
         raise HTTPException(status_code=404, detail="No provider probes configured")
-    if any(provider.status == "error" for provider in providers) and not all(
-        provider.status == "error" for provider in providers
-    ):
-        # Mixed success; surface warning but still return 200 payload
-        # Clients can inspect provider.status to show warnings.
-        return providers
+    # Mixed success still returns the full payload; clients inspect
+    # provider.status to show warnings.
     return providers
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
-from ..schemas.query import QueryRequest, QueryResponse, TraceOut, TraceStepOut
+from ..schemas.query import QueryRequest, QueryResponse, TraceOut
 from ..services import ServiceContainer, get_container
 
 router = APIRouter(prefix="/query", tags=["query"])
@@ -12,25 +13,20 @@ router = APIRouter(prefix="/query", tags=["query"])
 
 @router.post("", response_model=QueryResponse)
 async def ask(payload: QueryRequest, container: ServiceContainer = Depends(get_container)):
-    if not payload.question.strip():
+    question = payload.question
+    # isspace() scans in place; strip() would copy the whole prompt
+    if not question or question.isspace():
         raise HTTPException(status_code=400, detail="Question cannot be empty")
-    result = await container.orchestrator.answer(payload.question)
-    return QueryResponse(**result)
-
-
-@router.get("/traces", response_model=list[TraceOut])
-def list_traces(container: ServiceContainer = Depends(get_container)):
-    traces = container.telemetry.list()
-    return [
-        TraceOut(
-            id=trace.id,
-            prompt=trace.prompt,
-            answer=trace.answer,
-            metrics=trace.metrics,
-            steps=[
-                TraceStepOut(name=s.name, duration_ms=s.duration_ms, details=s.details, status=s.status)
-                for s in trace.steps
-            ],
-        )
-        for trace in traces
-    ]
+    # concurrent questions are coalesced into one retrieval pass; the result
+    # dict already matches QueryResponse and is validated once by FastAPI
+    return await container.query_batcher.submit(question)
+
+
+@router.get("/traces", response_model=list[TraceOut], response_class=ORJSONResponse)
+async def list_traces(
+    container: ServiceContainer = Depends(get_container),
+    limit: int = Query(default=100, ge=1),
+    include_steps: bool = Query(default=False, description="Include per-step timings for each trace"),
+):
+    rows = container.telemetry.summaries(limit=limit, include_steps=include_steps)
+    return ORJSONResponse(content=rows)
@@ -1,6 +1,8 @@
+from collections.abc import Mapping
 from enum import Enum
+from types import MappingProxyType
 
-from pydantic import AnyHttpUrl, BaseModel
+from pydantic import AnyHttpUrl, BaseModel, Field
 
 
 class ProviderConfig(BaseModel):
@@ -36,11 +38,14 @@ class RetrievalDefaults(BaseModel):
     graph: bool = False  # Graph retrieval disabled
     coverage_target: float = 0.7  # Target 70% coverage
     max_context_tokens: int = 4096  # Safe default for most local models
+    batch_max: int = 8  # Most concurrent /query calls answered in one retrieval pass
+    batch_wait_ms: int = 75  # How long the first queued question waits for others to join
 
 
-# Retrieval presets for different use cases
-RETRIEVAL_PRESETS = {
-    "fast": RetrievalDefaults(
+# Retrieval presets for different use cases. The values are known-good, so they
+# skip validation, and the read-only mapping lets every caller share them.
+RETRIEVAL_PRESETS: Mapping[str, RetrievalDefaults] = MappingProxyType({
+    "fast": RetrievalDefaults.model_construct(
         dense_k=3,
         sparse_k=5,
         top_n=3,
@@ -48,8 +53,8 @@ RETRIEVAL_PRESETS = {
         coverage_target=0.5,
         max_context_tokens=2048,
     ),
-    "balanced": RetrievalDefaults(),  # Uses defaults above
-    "thorough": RetrievalDefaults(
+    "balanced": RetrievalDefaults.model_construct(),  # Uses defaults above
+    "thorough": RetrievalDefaults.model_construct(
         dense_k=10,
         sparse_k=20,
         top_n=8,
@@ -57,14 +62,14 @@ RETRIEVAL_PRESETS = {
         coverage_target=0.9,
         max_context_tokens=8192,
     ),
-}
+})
 
 
 class AppConfig(BaseModel):
     profile: str = "Default"
     provider: ProviderConfig | None = None
     provider_profiles: list[ProviderProfile] = []
-    retrieval: RetrievalDefaults = RetrievalDefaults()
+    retrieval: RetrievalDefaults = Field(default_factory=lambda: RETRIEVAL_PRESETS["balanced"].model_copy())
 
 
 class ProviderKind(str, Enum):
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentOut(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     text: str
@@ -13,12 +15,22 @@ class DocumentOut(BaseModel):
 
 
 class IngestTextRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     text: str
     metadata: dict[str, str] | None = None
 
 
+class BulkIngestTextRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[IngestTextRequest]
+
+
 class IngestResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     document_id: str
     title: str
     chunk_count: int
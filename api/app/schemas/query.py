@@ -4,14 +4,18 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class QueryRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     question: str
 
 
 class ChunkOut(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     snippet: str
@@ -20,6 +24,8 @@ class ChunkOut(BaseModel):
 
 class PipelineStepOut(BaseModel):
     """A single step in the RAG pipeline with timing and details."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     duration_ms: float
     details: dict[str, Any] = {}
@@ -27,6 +33,8 @@ class PipelineStepOut(BaseModel):
 
 
 class QueryResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     answer: str
     chunks: list[ChunkOut]
     trace_id: str
@@ -34,15 +42,13 @@ class QueryResponse(BaseModel):
     steps: list[PipelineStepOut] = []
 
 
-class TraceStepOut(BaseModel):
-    """Step info for trace display."""
-    name: str
-    duration_ms: float
-    details: dict[str, Any] = {}
-    status: str = "completed"
+# trace steps have exactly the pipeline-step shape; share one compiled validator
+TraceStepOut = PipelineStepOut
 
 
 class TraceOut(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     prompt: str
     answer: str
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from functools import lru_cache
+import threading
 from pathlib import Path
 
+from fastapi import Request
+
 from .core import (
+    AnswerCache,
     ConfigStore,
     DocumentStore,
     Gatherer,
@@ -14,6 +18,7 @@ from .core import (
     Orchestrator,
     Planner,
     ProviderFactory,
+    QueryBatcher,
     RetrievalEngine,
     TelemetryStore,
 )
@@ -24,10 +29,11 @@ class ServiceContainer:
         data_dir = Path(base_path or os.environ.get("JR_DATA_DIR", Path.cwd() / "data"))
         data_dir.mkdir(parents=True, exist_ok=True)
         self.config_store = ConfigStore(data_dir / "config.json")
-        self.document_store = DocumentStore(data_dir / "documents.json")
-        self.telemetry = TelemetryStore(data_dir / "traces.json")
+        self.document_store = DocumentStore(data_dir / "documents.jsonl")
+        self.telemetry = TelemetryStore(data_dir / "traces.jsonl")
+        self.answer_cache = AnswerCache(data_dir / "answers.jsonl")
+        # the TF-IDF index is fitted on first retrieval, not while wiring services
         self.retrieval_engine = RetrievalEngine(self.document_store)
-        self.retrieval_engine.build()
         self.ingest = IngestPipeline(self.document_store, self.retrieval_engine)
         self.gatherer = Gatherer(self.retrieval_engine)
         cfg = self.config_store.read()
@@ -39,10 +45,31 @@ class ServiceContainer:
             gatherer=self.gatherer,
             provider_factory=self.provider_factory,
             telemetry=self.telemetry,
+            answer_cache=self.answer_cache,
         )
         self.orchestrator.rebuild(cfg)
+        self.query_batcher = QueryBatcher(self.orchestrator, self.planner)
+
+    async def warm(self) -> None:
+        """Fit the retrieval index in a worker thread so no request pays for it."""
+        await asyncio.to_thread(self.retrieval_engine.ensure_built)
+
+
+# serializes the lazy fallback so racing requests never open two stores on the same files
+_container_lock = threading.Lock()
+
 
+async def get_container(request: Request) -> ServiceContainer:
+    """Return the app's container: a plain attribute read once the lifespan has set it.
 
-@lru_cache(maxsize=1)
-def get_container() -> ServiceContainer:
-    return ServiceContainer()
+    Declared async so FastAPI resolves it inline instead of hopping to the threadpool.
+    """
+    state = request.app.state
+    container = getattr(state, "container", None)
+    if container is None:
+        # lifespan did not run (e.g. a TestClient used without `with`)
+        with _container_lock:
+            container = getattr(state, "container", None)
+            if container is None:
+                container = state.container = ServiceContainer()
+    return container
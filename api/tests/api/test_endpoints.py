@@ -5,7 +5,10 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import httpx
+import orjson
 import pytest
+import respx
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -59,3 +62,84 @@ def test_document_ingest_query_and_evaluation(client: TestClient) -> None:
     eval_data = eval_resp.json()
     assert eval_data["responses"], "evaluation should include responses"
     assert eval_data["average_coverage"] >= 0
+
+
+def test_evaluation_stream_emits_each_answer_then_summary(client: TestClient) -> None:
+    client.post("/documents/text", json={"title": "Intro", "text": "JR AutoRAG lets admins build RAG pipelines."})
+    payload = {"name": "Stream", "questions": ["What is JR AutoRAG?", "Who builds pipelines?"]}
+
+    resp = client.post("/evaluation/stream", json=payload)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [orjson.loads(line) for line in resp.content.splitlines()]
+
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1]
+    assert all(line["response"]["answer"] for line in lines[:-1])
+    assert lines[-1]["type"] == "summary"
+    assert lines[-1]["average_coverage"] >= 0
+
+
+def test_evaluation_stream_reports_failed_question_and_still_summarizes(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    orchestrator = app.dependency_overrides[get_container]().orchestrator
+    answer = orchestrator.answer
+
+    async def flaky(question: str) -> dict:
+        if question == "Broken?":
+            raise ValueError("malformed provider reply")
+        return await answer(question)
+
+    monkeypatch.setattr(orchestrator, "answer", flaky)
+    payload = {"name": "Flaky", "questions": ["What is JR AutoRAG?", "Broken?"]}
+
+    resp = client.post("/evaluation/stream", json=payload)
+    assert resp.status_code == 200
+    lines = [orjson.loads(line) for line in resp.content.splitlines()]
+
+    by_type = {line["type"]: line for line in lines}
+    assert by_type["response"]["index"] == 0
+    assert by_type["error"] == {"type": "error", "index": 1, "detail": "malformed provider reply"}
+    assert lines[-1]["type"] == "summary"
+    assert (lines[-1]["answered"], lines[-1]["failed"]) == (1, 1)
+
+
+def test_bulk_ingest_indexes_every_document(client: TestClient) -> None:
+    items = [
+        {"title": "Apples", "text": "Apples grow in orchards."},
+        {"title": "Tides", "text": "Tides follow the moon."},
+    ]
+    resp = client.post("/documents/bulk", json={"items": items})
+    assert resp.status_code == 200
+    assert [r["title"] for r in resp.json()] == ["Apples", "Tides"]
+
+    files = [
+        ("files", ("comets.txt", b"Comets have icy tails.", "text/plain")),
+        ("files", ("dunes.md", b"# Dunes\n\nDunes shift with the wind.", "text/markdown")),
+    ]
+    upload = client.post("/documents/upload/bulk", files=files)
+    assert upload.status_code == 200
+    assert len(upload.json()) == 2
+    assert len(client.get("/documents").json()) == 4
+
+    answer = client.post("/query", json={"question": "What shifts dunes?"}).json()
+    assert any(chunk["title"] == "dunes.md" for chunk in answer["chunks"])
+
+
+@respx.mock
+def test_repeated_question_is_served_from_answer_cache(client: TestClient) -> None:
+    chat = respx.post("http://ollama.test/api/chat").mock(
+        return_value=httpx.Response(200, json={"message": {"content": "A local RAG workbench."}})
+    )
+    config = client.get("/config").json()
+    config["provider"] = {"name": "Ollama", "base_url": "http://ollama.test", "generator_model": "llama3"}
+    assert client.put("/config", json=config).status_code == 200
+    client.post("/documents/text", json={"title": "Intro", "text": "JR AutoRAG lets admins build RAG pipelines."})
+
+    first = client.post("/query", json={"question": "What is JR AutoRAG?"}).json()
+    second = client.post("/query", json={"question": "what is  JR AutoRAG?"}).json()
+
+    assert first["answer"] == second["answer"] == "A local RAG workbench."
+    assert chat.call_count == 1
+    generation = next(step for step in second["steps"] if step["name"] == "generation")
+    assert generation["details"]["cache"] == "exact"
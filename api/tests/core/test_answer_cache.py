@@ -0,0 +1,22 @@
+"""Tests for the generated-answer cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.core import AnswerCache
+
+
+def test_only_the_same_question_hits(tmp_path: Path) -> None:
+    cache = AnswerCache(tmp_path / "answers.jsonl")
+    cache.store("When did the release ship?", "sig", "March")
+    cache.store("Are pipelines supported?", "sig", "Yes")
+
+    assert cache.lookup("when did  the release ship?", "sig") == "March"
+    assert cache.lookup("When did the release ship?", "other-evidence") is None
+    for question in ("Where did the release ship?", "Why did the release ship?", "Did the release not ship?"):
+        assert cache.lookup(question, "sig") is None
+    assert cache.lookup("Are pipelines not supported?", "sig") is None
+
+    # entries are replayed from answers.jsonl
+    assert AnswerCache(tmp_path / "answers.jsonl").lookup("Are pipelines supported?", "sig") == "Yes"
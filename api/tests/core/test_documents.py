@@ -0,0 +1,76 @@
+"""Tests for the JSONL-backed document store."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from app.core import DocumentStore
+from app.core import documents as documents_module
+from app.core.documents import Document
+
+
+def test_log_is_replayed_and_torn_tail_skipped(tmp_path: Path) -> None:
+    path = tmp_path / "documents.jsonl"
+    store = DocumentStore(path)
+    kept = store.add("Kept", "Stays around.", {"source": "test"})
+    gone = store.add("Gone", "Deleted soon.")
+    store.upsert(replace(kept, text="Edited."))
+    store.delete(gone.id)
+    store.close()
+    with path.open("ab") as handle:
+        handle.write(b'{"op":"add","doc":{"id":"torn","ti')
+
+    reopened = DocumentStore(path)
+    assert reopened.list() == [Document(id=kept.id, title="Kept", text="Edited.", metadata={"source": "test"})]
+    reopened.close()
+
+
+def test_log_is_compacted_to_live_documents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(documents_module, "_COMPACT_MIN_LINES", 4)
+    path = tmp_path / "documents.jsonl"
+    store = DocumentStore(path)
+    doc = store.add("Doc", "v0")
+    for version in range(1, 10):
+        store.upsert(replace(doc, text=f"v{version}"))
+    store.close()
+
+    assert len(path.read_bytes().splitlines()) < 10
+    reopened = DocumentStore(path)
+    assert [d.text for d in reopened.list()] == ["v9"]
+    reopened.close()
+
+
+def test_legacy_json_file_is_migrated(tmp_path: Path) -> None:
+    legacy = [
+        Document(id="a", title="A", text="Alpha.", metadata={}),
+        Document(id="b", title="B", text="Beta.", metadata={}),
+    ]
+    (tmp_path / "documents.json").write_bytes(msgspec.json.encode(legacy))
+
+    store = DocumentStore(tmp_path / "documents.jsonl")
+    assert store.list() == legacy
+    store.close()
+    assert len((tmp_path / "documents.jsonl").read_bytes().splitlines()) == 2
+
+
+def test_write_error_is_raised_and_log_repaired(tmp_path: Path) -> None:
+    path = tmp_path / "documents.jsonl"
+    store = DocumentStore(path)
+    store.flush()
+    store._handle = path.open("rb")  # every write now fails
+    first = store.add("First", "Queued before the failure surfaced.")
+
+    with pytest.raises(OSError):
+        store.flush()
+    # the rewrite queued by the failure restores the handle and the log
+    store.flush()
+    second = store.add("Second", "Written after the repair.")
+    store.close()
+
+    reopened = DocumentStore(path)
+    assert {d.id for d in reopened.list()} == {first.id, second.id}
+    reopened.close()
@@ -0,0 +1,54 @@
+"""Tests for micro-batching of concurrent questions."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import respx
+
+from app.schemas.config import ProviderConfig
+from app.services import ServiceContainer
+
+
+@respx.mock
+def test_failing_question_does_not_fail_its_batch(tmp_path: Path) -> None:
+    def reply(request: httpx.Request) -> httpx.Response:
+        if b"broken" in request.content:
+            return httpx.Response(200, content=b"not json")
+        return httpx.Response(200, json={"message": {"content": "Pipelines."}})
+
+    chat = respx.post("http://ollama.test/api/chat").mock(side_effect=reply)
+    container = ServiceContainer(base_path=tmp_path)
+    container.ingest.ingest_text(title="Intro", text="JR AutoRAG lets admins build RAG pipelines.")
+    cfg = container.config_store.read()
+    cfg.provider = ProviderConfig(name="Ollama", base_url="http://ollama.test", generator_model="llama3")
+    container.orchestrator.rebuild(cfg)
+
+    batches: list[list[str]] = []
+    answer_batch = container.orchestrator.answer_batch
+
+    async def spy(queries: list[str], return_exceptions: bool = False) -> list:
+        batches.append(queries)
+        return await answer_batch(queries, return_exceptions=return_exceptions)
+
+    container.orchestrator.answer_batch = spy  # type: ignore[method-assign]
+
+    async def ask_both() -> list:
+        batcher = container.query_batcher
+        return await asyncio.gather(
+            batcher.submit("What do admins build?"),
+            batcher.submit("Is this broken?"),
+            return_exceptions=True,
+        )
+
+    healthy, failed = asyncio.run(ask_both())
+    container.document_store.close()
+    container.telemetry.close()
+
+    assert batches == [["What do admins build?", "Is this broken?"]]
+    assert chat.call_count == 2
+    assert healthy["answer"] == "Pipelines."
+    assert failed["answer"].startswith("Provider error:")
+    assert "invalid JSON" in failed["answer"]
@@ -0,0 +1,32 @@
+"""Tests for the TF-IDF retrieval index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.core import DocumentStore, RetrievalEngine
+
+
+def test_remove_and_rebuild_publish_consistent_indexes(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path / "documents.jsonl")
+    engine = RetrievalEngine(store)
+    apples = store.add("Apples", "Apples grow in orchards.")
+    store.add("Tides", "Tides follow the moon.")
+    engine.build()
+    assert engine.query("orchards")[0].document.title == "Apples"
+
+    before = engine._index
+    store.delete(apples.id)
+    engine.remove(apples.id)
+    assert engine.query("orchards") == []
+    assert engine.query("moon")[0].document.title == "Tides"
+    # readers holding the old index still see its full, unchanged row map
+    assert [doc_id for doc_id, _ in before.chunk_map][0] == apples.id
+    assert before.matrix.shape[0] == len(before.chunk_map)
+
+    store.add("Comets", "Comets have icy tails.")
+    engine.build()
+    index = engine._index
+    assert index.matrix.shape == (len(index.chunk_map), len(index.vectorizer.vocabulary_))
+    assert engine.query("icy comets")[0].document.title == "Comets"
+    store.close()
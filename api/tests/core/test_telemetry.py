@@ -0,0 +1,37 @@
+"""Tests for the JSONL trace store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.core import TelemetryStore
+from app.core import telemetry as telemetry_module
+
+
+def test_tail_larger_than_byte_cap_does_not_rotate_every_record(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(telemetry_module, "_ROTATE_BYTES", 20_000)
+    rotations = 0
+    rotate = TelemetryStore._rotate
+
+    def counting_rotate(self: TelemetryStore) -> None:
+        nonlocal rotations
+        rotations += 1
+        rotate(self)
+
+    monkeypatch.setattr(TelemetryStore, "_rotate", counting_rotate)
+    path = tmp_path / "traces.jsonl"
+    # 100 retained traces of ~1 KB each: the tail alone is about 5x the cap
+    store = TelemetryStore(path, max_traces=100)
+    for i in range(300):
+        store.record(prompt=f"q{i}", answer="x" * 1000)
+    store.close()
+
+    # a few while the tail grows toward 100 KB, then one per 100 records; not one per record
+    assert rotations <= 8
+    reopened = TelemetryStore(path, max_traces=100)
+    assert [t.prompt for t in reopened.list()] == [f"q{i}" for i in range(200, 300)]
+    reopened.close()